@@ -0,0 +1,16 @@
+"""Shared compiled-regex cache.
+
+Naming patterns come from stage configs and are identical for every asset in
+a batch run.  Compiling through here keeps each pattern compiled once for the
+life of the process instead of competing for slots in ``re``'s own small
+internal cache.
+"""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def compile(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
@@ -15,9 +15,9 @@ vertex *i*.  An empty list signals that vertex *i* has no group assignments
 """
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass, field
 
+from pipeline import _re_cache
 from pipeline.schema import CheckResult, StageResult, Status
 
 # ---------------------------------------------------------------------------
@@ -116,7 +116,7 @@ def _check_bone_naming(
             message="Bone naming check skipped (no pattern configured)",
         )
 
-    pattern = re.compile(config.bone_naming_pattern)
+    pattern = _re_cache.compile(config.bone_naming_pattern)
     violations = []
     for arm in armatures:
         for bone in arm.bones():
@@ -32,13 +32,17 @@ class AutofixConfig:
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _find_check(stage1_results: list[StageResult], stage_name, check_name):
+def _index_checks(stage1_results: list[StageResult]):
+    """Map ``(stage_name, check_name)`` to its check, built once per run.
+
+    The first stage and check with a given name win, as a front-to-back
+    scan would find them.
+    """
+    index = {}
     for stage in stage1_results:
-        if stage.name == stage_name:
-            for check in stage.checks:
-                if check.name == check_name:
-                    return check
-    return None
+        for check_name, check in stage.checks_by_name.items():
+            index.setdefault((stage.name, check_name), check)
+    return index
 
 
 def _largest_pot(n):
@@ -82,11 +86,11 @@ _REVIEW_RULES = [
 ]
 
 
-def _collect_review_flags(stage1_results: list[StageResult]) -> list[ReviewFlag]:
+def _collect_review_flags(checks: dict) -> list[ReviewFlag]:
     flags: list[ReviewFlag] = []
 
     for stage_name, check_name, trigger_status, severity, description in _REVIEW_RULES:
-        check = _find_check(stage1_results, stage_name, check_name)
+        check = checks.get((stage_name, check_name))
         if check and check.status == trigger_status:
             flags.append(ReviewFlag(
                 issue=f"{stage_name}:{check_name}",
@@ -94,7 +98,7 @@ def _collect_review_flags(stage1_results: list[StageResult]) -> list[ReviewFlag]
                 description=description,
             ))
 
-    polycount_check = _find_check(stage1_results, "geometry", "polycount_budget")
+    polycount_check = checks.get(("geometry", "polycount_budget"))
     if polycount_check and polycount_check.status == Status.FAIL:
         flags.append(ReviewFlag(
             issue="geometry:polycount_budget",
@@ -116,9 +120,10 @@ def run_autofix(context, stage1_results: list[StageResult], config: AutofixConfi
     because autofix does not fail the pipeline — it either fixes or flags.
     """
     fixes: list[FixEntry] = []
+    checks = _index_checks(stage1_results)
 
     # Fix 1: recalculate_normals
-    normal_check = _find_check(stage1_results, "geometry", "normal_consistency")
+    normal_check = checks.get(("geometry", "normal_consistency"))
     if normal_check and normal_check.status == Status.FAIL:
         before_count = normal_check.value
         for obj in context.mesh_objects():
@@ -131,8 +136,8 @@ def run_autofix(context, stage1_results: list[StageResult], config: AutofixConfi
             ))
 
     # Fix 2: merge_by_distance
-    degenerate_check = _find_check(stage1_results, "geometry", "degenerate_faces")
-    loose_check = _find_check(stage1_results, "geometry", "loose_geometry")
+    degenerate_check = checks.get(("geometry", "degenerate_faces"))
+    loose_check = checks.get(("geometry", "loose_geometry"))
     needs_merge = (
         (degenerate_check is not None and degenerate_check.status == Status.FAIL)
         or (loose_check is not None and loose_check.status == Status.FAIL)
@@ -149,7 +154,7 @@ def run_autofix(context, stage1_results: list[StageResult], config: AutofixConfi
             ))
 
     # Fix 3: resize_textures
-    texture_check = _find_check(stage1_results, "texture", "resolution_limit")
+    texture_check = checks.get(("texture", "resolution_limit"))
     if texture_check and texture_check.status == Status.FAIL:
         limit = 4096 if config.hero_asset else config.max_texture_resolution
         for img in context.images():
@@ -165,7 +170,7 @@ def run_autofix(context, stage1_results: list[StageResult], config: AutofixConfi
                 ))
 
     # Fix 4: limit_bone_weights
-    weight_check = _find_check(stage1_results, "armature", "vertex_weights")
+    weight_check = checks.get(("armature", "vertex_weights"))
     if weight_check and weight_check.status == Status.FAIL:
         skinned = context.skinned_meshes()
         before_max = max((m.max_influences() for m in skinned), default=0)
@@ -177,7 +182,7 @@ def run_autofix(context, stage1_results: list[StageResult], config: AutofixConfi
             after=config.max_bone_influences,
         ))
 
-    review_flags = _collect_review_flags(stage1_results)
+    review_flags = _collect_review_flags(checks)
 
     return StageResult(
         name="autofix",
@@ -6,15 +6,21 @@ correct directory based on the overall QA status.
 """
 from __future__ import annotations
 
-import dataclasses
 import json
+import os
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
 
+from pipeline import _fs
 from pipeline.report_builder import ReportBuilder
 from pipeline.schema import ExportInfo, QaReport, StageResult, Status
 
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
+
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -28,6 +34,10 @@ class ExportConfig:
     quarantine_dir: str
     format: str = "gltf"
     embed_textures: bool = False
+    # Route by hardlinking out of output_dir when on the same filesystem.
+    # Opt-in: a routed link shares its inode with the output_dir copy, so any
+    # in-place writer other than run_export would change the delivered file.
+    use_hardlinks: bool = False
 
 
 # ---------------------------------------------------------------------------
@@ -48,6 +58,46 @@ CATEGORY_FOLDER = {
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+def _write_manifest(manifest_path: Path, qa_report: QaReport):
+    """Write the QA sidecar manifest as indented JSON.
+
+    Uses ``orjson`` when installed (several times faster than the stdlib
+    encoder with ``indent``); output is equivalent apart from whitespace and
+    non-ASCII escaping.
+    """
+    data = qa_report.to_dict()
+    # Written under a temporary name and renamed over the old manifest, so the
+    # new one is a fresh inode and a routed hardlink to the old one is kept.
+    tmp = manifest_path.with_name(f".{manifest_path.name}.tmp")
+    if orjson is not None:
+        tmp.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    else:
+        tmp.write_text(json.dumps(data, indent=2))
+    os.replace(tmp, manifest_path)
+
+
+def _place(src: Path, dst: Path, use_hardlinks: bool):
+    """Place *src* at *dst*, hardlinking when possible.
+
+    The link is made under a temporary name and then promoted with
+    ``os.replace`` so *dst* is swapped atomically, even when a previous run
+    left a file there.  Cross-device links (``EXDEV``) and filesystems
+    without hardlink support fall back to :func:`pipeline._fs.fast_copy`.
+    """
+    if use_hardlinks:
+        tmp = dst.with_name(f".{dst.name}.tmp")
+        try:
+            tmp.unlink(missing_ok=True)
+            os.link(src, tmp)
+            os.replace(tmp, dst)
+            return
+        except OSError:
+            tmp.unlink(missing_ok=True)
+    _fs.fast_copy(src, dst)
+
+
 def _route(qa_report: QaReport, export_path, manifest_path, config: ExportConfig, asset_id, category):
     status = qa_report.status
 
@@ -60,8 +110,8 @@ def _route(qa_report: QaReport, export_path, manifest_path, config: ExportConfig
         dest = Path(config.quarantine_dir) / asset_id
 
     dest.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(str(export_path), str(dest / export_path.name))
-    shutil.copy2(str(manifest_path), str(dest / manifest_path.name))
+    _place(export_path, dest / export_path.name, config.use_hardlinks)
+    _place(manifest_path, dest / manifest_path.name, config.use_hardlinks)
 
 
 # ---------------------------------------------------------------------------
@@ -78,10 +128,21 @@ def run_export(context, report_builder: ReportBuilder, config: ExportConfig) ->
     export_path = asset_out_dir / f"{asset_id}.{config.format}"
     manifest_path = asset_out_dir / f"{asset_id}_qa.json"
 
+    # Export into a staging directory and move the results into place only
+    # once the exporter has succeeded.  A failed re-export then keeps the
+    # previous outputs, and the renamed files are fresh inodes, so copies an
+    # earlier run hardlinked into a routing folder are never rewritten.
+    staging = asset_out_dir / ".staging"
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir()
+    staged_export = staging / export_path.name
     if config.format == "gltf":
-        context.export_gltf(str(export_path), config.embed_textures)
+        context.export_gltf(str(staged_export), config.embed_textures)
     else:
-        context.export_fbx(str(export_path))
+        context.export_fbx(str(staged_export))
+    for entry in staging.iterdir():
+        os.replace(entry, asset_out_dir / entry.name)
+    staging.rmdir()
 
     export_info = ExportInfo(
         format=config.format,
@@ -92,7 +153,7 @@ def run_export(context, report_builder: ReportBuilder, config: ExportConfig) ->
     report_builder.set_export(export_info)
     qa_report = report_builder.finalize()
 
-    manifest_path.write_text(json.dumps(dataclasses.asdict(qa_report), indent=2))
+    _write_manifest(manifest_path, qa_report)
 
     _route(qa_report, export_path, manifest_path, config, asset_id, category)
 
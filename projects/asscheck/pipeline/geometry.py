@@ -6,7 +6,9 @@ loose geometry, and interior faces.
 """
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 
 from pipeline.schema import CheckResult, StageResult, Status
 
@@ -14,12 +16,15 @@ from pipeline.schema import CheckResult, StageResult, Status
 # Default triangle budgets per asset category
 # ---------------------------------------------------------------------------
 
-_DEFAULT_BUDGETS = {
+# Read-only module table; each ``GeometryConfig`` gets its own plain-dict
+# copy so configs stay copyable and serialisable (``asdict``/``deepcopy``).
+_DEFAULT_BUDGETS: Mapping[str, tuple[int, int]] = MappingProxyType({
     "env_prop":  (500,   5_000),
     "hero_prop": (5_000, 15_000),
     "character": (15_000, 30_000),
     "vehicle":   (10_000, 25_000),
-}
+})
+_FALLBACK_BUDGET = _DEFAULT_BUDGETS["env_prop"]
 
 
 # ---------------------------------------------------------------------------
@@ -54,10 +59,9 @@ def _check_polycount(
     config: GeometryConfig,
 ) -> CheckResult:
     total = sum(obj.triangle_count() for obj in mesh_objects)
-    budget = config.triangle_budgets.get(
-        config.category, _DEFAULT_BUDGETS.get("env_prop", (500, 5_000))
+    min_tris, max_tris = config.triangle_budgets.get(
+        config.category, _FALLBACK_BUDGET
     )
-    min_tris, max_tris = budget
 
     if total < min_tris or total > max_tris:
         return CheckResult(
@@ -79,8 +83,64 @@ def _check_polycount(
     )
 
 
-def _check_non_manifold(all_bm) -> CheckResult:
-    count = sum(1 for bm in all_bm for e in bm.edges if not e.is_manifold)
+@dataclass(slots=True)
+class _MeshCounts:
+    """Per-check totals gathered by :func:`_scan_bmesh` across all meshes."""
+
+    non_manifold: int = 0
+    degenerate: int = 0
+    loose: int = 0
+    interior: int = 0
+    inconsistent_faces: set = field(default_factory=set)
+
+
+def _scan_bmesh(bm, counts: _MeshCounts) -> None:
+    """Accumulate every bmesh-based check over *bm* into *counts*.
+
+    One sweep each over edges, faces and verts instead of a sweep per check;
+    each edge's linked faces are read once and reused by the face sweep.
+    """
+    crowded = set()  # edges shared by more than two faces
+    shared = []      # edges shared by exactly two faces
+    for edge in bm.edges:
+        n_faces = len(edge.link_faces)
+        if not edge.is_manifold:
+            counts.non_manifold += 1
+        if n_faces == 0:
+            counts.loose += 1
+        elif n_faces == 2:
+            shared.append(edge)
+        elif n_faces > 2:
+            crowded.add(edge)
+
+    # Winding ledger: every loop XORs the hash of the vertex it leaves its
+    # edge from into that edge's entry.  Two faces that share an edge are
+    # consistently wound when they traverse it in opposite directions, i.e.
+    # from different vertices, leaving a non-zero entry; the same start
+    # vertex cancels to zero and means one of them has a flipped normal.
+    ledger = {}
+    for face in bm.faces:
+        if face.calc_area() < 1e-6:
+            counts.degenerate += 1
+        loops = face.loops
+        for loop in loops:
+            edge = loop.edge
+            ledger[edge] = ledger.get(edge, 0) ^ hash(loop.vert)
+        # Interior heuristic: every edge of the face is shared by 3+ faces.
+        if crowded and loops and all(loop.edge in crowded for loop in loops):
+            counts.interior += 1
+
+    for edge in shared:
+        if not ledger[edge]:
+            f1, f2 = edge.link_faces
+            counts.inconsistent_faces.add(id(f1))
+            counts.inconsistent_faces.add(id(f2))
+
+    counts.loose += sum(1 for v in bm.verts if not v.link_faces)
+
+
+def _check_non_manifold(counts: _MeshCounts) -> CheckResult:
+    count = counts.non_manifold
     return CheckResult(
         name="non_manifold",
         status=Status.FAIL if count > 0 else Status.PASS,
@@ -93,8 +153,8 @@ def _check_non_manifold(all_bm) -> CheckResult:
     )
 
 
-def _check_degenerate_faces(all_bm) -> CheckResult:
-    count = sum(1 for bm in all_bm for f in bm.faces if f.calc_area() < 1e-6)
+def _check_degenerate_faces(counts: _MeshCounts) -> CheckResult:
+    count = counts.degenerate
     return CheckResult(
         name="degenerate_faces",
         status=Status.FAIL if count > 0 else Status.PASS,
@@ -107,41 +167,13 @@ def _check_degenerate_faces(all_bm) -> CheckResult:
     )
 
 
-def _check_normal_consistency(all_bm) -> CheckResult:
-    """Detect faces with inconsistent winding order relative to neighbours.
-
-    Two faces that share an edge are *consistently* wound when they traverse
-    that edge in *opposite* directions.  If both faces traverse the edge
-    starting from the same vertex, one of them has a flipped normal.
+def _check_normal_consistency(counts: _MeshCounts) -> CheckResult:
+    """Report faces with inconsistent winding order relative to neighbours.
 
-    Uses ``edge.link_faces``, ``face.loops``, ``loop.edge`` and ``loop.vert``.
+    Detected in :func:`_scan_bmesh` via ``edge.link_faces``, ``face.loops``,
+    ``loop.edge`` and ``loop.vert``.
     """
-    inconsistent = set()
-    for bm in all_bm:
-        for edge in bm.edges:
-            if len(edge.link_faces) != 2:
-                continue
-            f1, f2 = edge.link_faces[0], edge.link_faces[1]
-
-            v_in_f1 = None
-            for loop in f1.loops:
-                if loop.edge is edge:
-                    v_in_f1 = loop.vert
-                    break
-
-            v_in_f2 = None
-            for loop in f2.loops:
-                if loop.edge is edge:
-                    v_in_f2 = loop.vert
-                    break
-
-            # Same start-vert → both faces traverse the edge in the same
-            # direction → normals are inconsistent.
-            if v_in_f1 is not None and v_in_f2 is not None and v_in_f1 is v_in_f2:
-                inconsistent.add(id(f1))
-                inconsistent.add(id(f2))
-
-    count = len(inconsistent)
+    count = len(counts.inconsistent_faces)
     return CheckResult(
         name="normal_consistency",
         status=Status.FAIL if count > 0 else Status.PASS,
@@ -154,12 +186,9 @@ def _check_normal_consistency(all_bm) -> CheckResult:
     )
 
 
-def _check_loose_geometry(all_bm) -> CheckResult:
+def _check_loose_geometry(counts: _MeshCounts) -> CheckResult:
     """Count vertices with no linked faces and edges with no linked faces."""
-    count = 0
-    for bm in all_bm:
-        count += sum(1 for v in bm.verts if len(v.link_faces) == 0)
-        count += sum(1 for e in bm.edges if len(e.link_faces) == 0)
+    count = counts.loose
     return CheckResult(
         name="loose_geometry",
         status=Status.FAIL if count > 0 else Status.PASS,
@@ -172,19 +201,13 @@ def _check_loose_geometry(all_bm) -> CheckResult:
     )
 
 
-def _check_interior_faces(all_bm) -> CheckResult:
+def _check_interior_faces(counts: _MeshCounts) -> CheckResult:
     """Heuristic: faces whose every edge is shared by more than 2 faces.
 
     When all of a face's edges have 3+ linked faces the face is likely
     enclosed inside the mesh volume (interior geometry).
     """
-    count = 0
-    for bm in all_bm:
-        for face in bm.faces:
-            if face.loops and all(
-                len(loop.edge.link_faces) > 2 for loop in face.loops
-            ):
-                count += 1
+    count = counts.interior
     return CheckResult(
         name="interior_faces",
         status=Status.FAIL if count > 0 else Status.PASS,
@@ -208,15 +231,17 @@ def check_geometry(context, config: GeometryConfig) -> StageResult:
     checks.
     """
     mesh_objects = context.mesh_objects()
-    all_bm = [obj.bmesh_get() for obj in mesh_objects]
+    counts = _MeshCounts()
+    for obj in mesh_objects:
+        _scan_bmesh(obj.bmesh_get(), counts)
 
     checks = [
         _check_polycount(mesh_objects, config),
-        _check_non_manifold(all_bm),
-        _check_degenerate_faces(all_bm),
-        _check_normal_consistency(all_bm),
-        _check_loose_geometry(all_bm),
-        _check_interior_faces(all_bm),
+        _check_non_manifold(counts),
+        _check_degenerate_faces(counts),
+        _check_normal_consistency(counts),
+        _check_loose_geometry(counts),
+        _check_interior_faces(counts),
     ]
 
     stage_status = (
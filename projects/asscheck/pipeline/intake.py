@@ -12,7 +12,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from pipeline.report_builder import ReportBuilder
-from pipeline.schema import CheckResult, QaReport, StageResult, Status
+from pipeline.schema import CheckResult, QaReport, StageResult, Status, stage_to_dict
 
 ACCEPTED_EXTENSIONS = frozenset({".fbx", ".gltf", ".glb", ".obj"})
 
@@ -139,7 +139,6 @@ def _parse_args(argv=None):
 
 
 if __name__ == "__main__":
-    import dataclasses
     args = _parse_args()
     config = IntakeConfig(
         file_path=args.file,
@@ -151,5 +150,5 @@ if __name__ == "__main__":
     )
     report = run_intake(config)
     intake_stage = report.stages[0]
-    print(json.dumps(dataclasses.asdict(intake_stage), indent=2))
+    print(json.dumps(stage_to_dict(intake_stage), indent=2))
     sys.exit(0 if intake_stage.status == Status.PASS else 1)
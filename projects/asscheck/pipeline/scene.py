@@ -10,9 +10,9 @@ caller should pass the ``PerformanceEstimates`` to
 """
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
 
+from pipeline import _re_cache
 from pipeline.schema import (
     CheckResult,
     PerformanceEstimates,
@@ -39,8 +39,12 @@ class SceneConfig:
 # ---------------------------------------------------------------------------
 
 def _check_naming_conventions(mesh_objects, config: SceneConfig) -> CheckResult:
-    pattern = re.compile(config.object_naming_pattern)
-    violations = [obj.name for obj in mesh_objects if not pattern.match(obj.name)]
+    match = _re_cache.compile(config.object_naming_pattern).match
+    violations = []
+    for obj in mesh_objects:
+        name = obj.name
+        if match(name) is None:
+            violations.append(name)
     count = len(violations)
     return CheckResult(
         name="naming_conventions",
@@ -71,17 +75,29 @@ def _check_orphan_data(orphan_counts) -> CheckResult:
     )
 
 
+# Results for presence checks that are switched off.  CheckResult is frozen
+# and the values are scalars, so one instance is shared by every asset.
+_LOD_SKIPPED = CheckResult(
+    name="lod_presence",
+    status=Status.SKIPPED,
+    value=0,
+    threshold=None,
+    message="LOD presence check skipped (not required)",
+)
+_COLLISION_SKIPPED = CheckResult(
+    name="collision_presence",
+    status=Status.SKIPPED,
+    value=0,
+    threshold=None,
+    message="Collision presence check skipped (not required)",
+)
+
+
 def _check_lod_presence(mesh_objects, config: SceneConfig) -> CheckResult:
     if not config.require_lod:
-        return CheckResult(
-            name="lod_presence",
-            status=Status.SKIPPED,
-            value=0,
-            threshold=None,
-            message="LOD presence check skipped (not required)",
-        )
+        return _LOD_SKIPPED
 
-    pattern = re.compile(config.lod_suffix_pattern)
+    pattern = _re_cache.compile(config.lod_suffix_pattern)
     count = sum(1 for obj in mesh_objects if pattern.search(obj.name))
 
     if count == 0:
@@ -104,15 +120,9 @@ def _check_lod_presence(mesh_objects, config: SceneConfig) -> CheckResult:
 
 def _check_collision_presence(mesh_objects, config: SceneConfig) -> CheckResult:
     if not config.require_collision:
-        return CheckResult(
-            name="collision_presence",
-            status=Status.SKIPPED,
-            value=0,
-            threshold=None,
-            message="Collision presence check skipped (not required)",
-        )
+        return _COLLISION_SKIPPED
 
-    pattern = re.compile(config.collision_suffix_pattern)
+    pattern = _re_cache.compile(config.collision_suffix_pattern)
     count = sum(1 for obj in mesh_objects if pattern.search(obj.name))
 
     if count == 0:
@@ -150,10 +160,19 @@ def _compute_performance(mesh_objects, armature_objects, unique_images) -> Perfo
     triangles = sum(obj.triangle_count() for obj in mesh_objects)
     draw_calls = sum(obj.material_slot_count() for obj in mesh_objects)
 
-    vram_mb = 0.0
+    # Batch pixel counts per (channels, bit_depth) format so the multiply and
+    # the float conversion happen once per format rather than once per image.
+    # Integer accumulation keeps the total exact for any number of images.
+    pixels_by_format: dict[tuple[int, int], int] = {}
     for img in unique_images:
-        bytes_raw = img.width * img.height * img.channels * img.bit_depth / 8
-        vram_mb += bytes_raw / 1024.0 / 1024.0 * _MIP_MULTIPLIER
+        fmt = (img.channels, img.bit_depth)
+        pixels_by_format[fmt] = pixels_by_format.get(fmt, 0) + img.width * img.height
+
+    bits_raw = sum(
+        pixels * channels * bit_depth
+        for (channels, bit_depth), pixels in pixels_by_format.items()
+    )
+    vram_mb = bits_raw / 8 / 1024.0 / 1024.0 * _MIP_MULTIPLIER
 
     bones = sum(arm.bone_count() for arm in armature_objects)
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
 from enum import Enum
 from typing import Any, Optional
 
@@ -16,7 +16,7 @@ class Status(str, Enum):
     INFO = "INFO"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CheckResult:
     name: str
     status: Status
@@ -25,7 +25,7 @@ class CheckResult:
     message: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FixEntry:
     action: str
     target: str
@@ -33,14 +33,14 @@ class FixEntry:
     after: Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewFlag:
     issue: str
     severity: Status
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class StageResult:
     name: str
     status: Status
@@ -48,8 +48,17 @@ class StageResult:
     fixes: list[FixEntry] = field(default_factory=list)
     flags: list[ReviewFlag] = field(default_factory=list)
 
+    @property
+    def checks_by_name(self) -> dict[str, CheckResult]:
+        """Checks keyed by name; the first wins if a name repeats.
 
-@dataclass(frozen=True)
+        Built on each access, since ``checks`` is a plain mutable list; take
+        it once when looking up several checks.
+        """
+        return {c.name: c for c in reversed(self.checks)}
+
+
+@dataclass(frozen=True, slots=True)
 class PerformanceEstimates:
     triangles: int
     draw_calls: int
@@ -57,7 +66,7 @@ class PerformanceEstimates:
     bones: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExportInfo:
     format: str
     path: str
@@ -65,7 +74,7 @@ class ExportInfo:
     scale: float
 
 
-@dataclass
+@dataclass(slots=True)
 class QaReport:
     asset_id: str
     source: str
@@ -77,3 +86,100 @@ class QaReport:
     stages: list[StageResult] = field(default_factory=list)
     performance: Optional[PerformanceEstimates] = None
     export: Optional[ExportInfo] = None
+
+    def to_dict(self) -> dict:
+        return report_to_dict(self)
+
+
+# ---------------------------------------------------------------------------
+# Serialisation
+# ---------------------------------------------------------------------------
+#
+# Plain-dict conversion for the JSON manifest, in the shape
+# ``dataclasses.asdict`` produces but without its generic deep copy: check
+# values are only walked to turn dataclass records nested in them (e.g.
+# texture violations) into dicts, and scalars pass straight through.
+
+# ``Status.value`` goes through the enum property descriptor on every access;
+# a dict keyed by member is several times cheaper.
+_STATUS_STR = {s: s.value for s in Status}
+
+
+def _plain(value):
+    """Return *value* with any nested dataclass records converted to dicts."""
+    if isinstance(value, (str, int, float, type(None))):
+        return value
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _plain(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_plain(v) for v in value)
+    return value
+
+
+def check_to_dict(check: CheckResult) -> dict:
+    return {
+        "name": check.name,
+        "status": _STATUS_STR[check.status],
+        "value": _plain(check.value),
+        "threshold": check.threshold,
+        "message": check.message,
+    }
+
+
+def fix_to_dict(fix: FixEntry) -> dict:
+    return {
+        "action": fix.action,
+        "target": fix.target,
+        "before": fix.before,
+        "after": fix.after,
+    }
+
+
+def flag_to_dict(flag: ReviewFlag) -> dict:
+    return {
+        "issue": flag.issue,
+        "severity": _STATUS_STR[flag.severity],
+        "description": flag.description,
+    }
+
+
+def stage_to_dict(stage: StageResult) -> dict:
+    return {
+        "name": stage.name,
+        "status": _STATUS_STR[stage.status],
+        "checks": [check_to_dict(c) for c in stage.checks],
+        "fixes": [fix_to_dict(f) for f in stage.fixes],
+        "flags": [flag_to_dict(f) for f in stage.flags],
+    }
+
+
+def report_to_dict(report: QaReport) -> dict:
+    """Return *report* as a JSON-ready dict (same shape as ``asdict``)."""
+    performance = report.performance
+    export = report.export
+    return {
+        "asset_id": report.asset_id,
+        "source": report.source,
+        "category": report.category,
+        "submitter": report.submitter,
+        "submitted": report.submitted,
+        "processed": report.processed,
+        "status": _STATUS_STR[report.status],
+        "stages": [stage_to_dict(s) for s in report.stages],
+        "performance": None if performance is None else {
+            "triangles": performance.triangles,
+            "draw_calls": performance.draw_calls,
+            "vram_mb": performance.vram_mb,
+            "bones": performance.bones,
+        },
+        "export": None if export is None else {
+            "format": export.format,
+            "path": export.path,
+            "axis": export.axis,
+            "scale": export.scale,
+        },
+    }
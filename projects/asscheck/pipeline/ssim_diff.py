@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 
@@ -23,12 +24,17 @@ class SSIMResult:
 # Filename parsing helpers
 # ---------------------------------------------------------------------------
 
+# Anchored at the end and free of separators, so it can be searched against
+# the full path without splitting off the basename first.
+_TURNTABLE_RE = re.compile(r"_turntable_(\d{3})\.png$")
+
+
 def _parse_angle_from_path(path):
     """Extract the angle (int degrees) from a turntable filename.
 
     Expected pattern: ``{asset_id}_turntable_{angle:03d}.png``
     """
-    m = re.search(r"_turntable_(\d{3})\.png$", os.path.basename(path))
+    m = _TURNTABLE_RE.search(os.fspath(path))
     return int(m.group(1)) if m else None
 
 
@@ -36,15 +42,91 @@ def _parse_angle_from_path(path):
 # Default SSIM computation (requires scikit-image + Pillow)
 # ---------------------------------------------------------------------------
 
+def _opencv_ssim(img1, img2):
+    """SSIM via OpenCV's contrib ``quality`` module, or None if unavailable.
+
+    OpenCV uses the Wang et al. window (11x11 Gaussian, sigma 1.5) where
+    scikit-image defaults to a 7x7 uniform window, so its scores differ
+    slightly from the default backend; golden references and
+    ``SSIM_THRESHOLD`` are tuned against scikit-image.
+    """
+    try:
+        import cv2
+        quality = cv2.quality
+    except (ImportError, AttributeError):
+        return None
+    mssim, ssim_map = quality.QualitySSIM_compute(img1, img2)
+    return float(mssim[0]), ssim_map
+
+
+# ITU-R 601 luma weights, matching Pillow's ``convert("L")``.
+_LUMA = [[0.299, 0.587, 0.114]]
+
+
+def _load_grey_vips(path):
+    """Decode an 8-bit PNG straight to greyscale with libvips, or None.
+
+    Returns None when pyvips is not installed or the image is not 8-bit, so
+    the caller falls back to Pillow.  Luma uses Pillow's weights and rounding
+    so both decoders yield the same pixels to within one grey level.
+    """
+    try:
+        import pyvips
+    except ImportError:
+        return None
+    import numpy as np
+
+    img = pyvips.Image.new_from_file(os.fspath(path), access="sequential")
+    if img.format != "uchar":
+        return None
+    if img.bands >= 3:
+        img = (img.extract_band(0, n=3).recomb(_LUMA) + 0.5).cast("uchar")
+    elif img.bands == 2:  # grey + alpha
+        img = img.extract_band(0)
+    buf = img.write_to_memory()
+    return np.frombuffer(buf, dtype=np.uint8).reshape(img.height, img.width)
+
+
+def _load_grey(path):
+    """Load *path* as a 2-D ``uint8`` greyscale array."""
+    if os.fspath(path).lower().endswith(".png"):
+        arr = _load_grey_vips(path)
+        if arr is not None:
+            return arr
+
+    import numpy as np
+    from PIL import Image
+
+    return np.array(Image.open(path).convert("L"))
+
+
 def _default_ssim_fn(path1, path2):
     """Compute SSIM between two images.  Returns (score, diff_array).
 
     Requires ``scikit-image`` and ``Pillow``.  Both images are converted to
     greyscale before comparison so that channel count differences are handled.
+    When ``opencv-contrib-python`` is installed its SIMD SSIM kernel is used
+    instead of scikit-image's (scores differ slightly, see
+    :func:`_opencv_ssim`), and when ``pyvips`` is installed PNGs are
+    decoded to greyscale by libvips instead of Pillow.
     """
     try:
-        import numpy as np
-        from PIL import Image
+        import numpy  # noqa: F401
+        import PIL  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            "scikit-image and Pillow are required for SSIM computation. "
+            "Install with: pip install scikit-image Pillow"
+        ) from exc
+
+    img1 = _load_grey(path1)
+    img2 = _load_grey(path2)
+
+    fast = _opencv_ssim(img1, img2)
+    if fast is not None:
+        return fast
+
+    try:
         from skimage.metrics import structural_similarity
     except ImportError as exc:
         raise ImportError(
@@ -52,22 +134,28 @@ def _default_ssim_fn(path1, path2):
             "Install with: pip install scikit-image Pillow"
         ) from exc
 
-    img1 = np.array(Image.open(path1).convert("L"))
-    img2 = np.array(Image.open(path2).convert("L"))
     score, diff = structural_similarity(img1, img2, full=True)
     return float(score), diff
 
 
 def _save_diff_image(diff_arr, path):
-    """Save an SSIM diff array as a PNG highlighting changed pixels."""
+    """Save an SSIM diff array as a PNG highlighting changed pixels.
+
+    ``diff_arr`` is used as scratch space and is overwritten.
+    """
     try:
         import numpy as np
         from PIL import Image
 
         # SSIM map is high where similar, low where different.
-        # Invert so that changed pixels appear bright.
-        changed = 1.0 - diff_arr
-        changed = (changed * 255).clip(0, 255).astype(np.uint8)
+        # Invert so that changed pixels appear bright: 255 - 255 * ssim,
+        # computed in place rather than through full-size temporaries.
+        diff = np.asarray(diff_arr, dtype=np.float64)
+        np.multiply(diff, -255.0, out=diff)
+        np.add(diff, 255.0, out=diff)
+        np.clip(diff, 0, 255, out=diff)
+        changed = np.empty(diff.shape, dtype=np.uint8)
+        np.copyto(changed, diff, casting="unsafe")
         Image.fromarray(changed).save(path)
     except ImportError:
         pass  # Skip diff image if Pillow unavailable
@@ -80,20 +168,47 @@ def _save_diff_image(diff_arr, path):
 SSIM_THRESHOLD = 0.85
 
 
+def _compare_pair(compute, render_path, ref_path, angle) -> SSIMResult:
+    """Score one render against its reference and write a diff if flagged."""
+    score, diff_arr = compute(render_path, ref_path)
+    flagged = score < SSIM_THRESHOLD
+
+    diff_path = None
+    if flagged and diff_arr is not None:
+        diff_path = render_path[:-4] + "_diff.png"
+        _save_diff_image(diff_arr, diff_path)
+
+    return SSIMResult(
+        angle=angle,
+        score=score,
+        diff_image_path=diff_path,
+        flagged=flagged,
+    )
+
+
 def compare_renders(
     new_renders,
     reference_dir,
     *,
+    max_workers=None,
     _compute_ssim=None,
 ) -> list[SSIMResult]:
     """Compare new turntable renders against golden references.
 
+    Render/reference pairs are independent, so they are scored on a thread
+    pool.  Image decoding (Pillow) and the SSIM kernel (scikit-image/NumPy)
+    release the GIL, and threads accept any ``_compute_ssim`` callable,
+    picklable or not.
+
     Parameters
     ----------
     new_renders:
         Paths to the newly-rendered PNG files.
     reference_dir:
         Directory containing golden reference images with the same filenames.
+    max_workers:
+        Thread count for scoring.  ``None`` uses the executor default;
+        ``1`` scores serially on the calling thread.
     _compute_ssim:
         Optional callable ``(path1, path2) -> (float, array|None)``.
         Defaults to :func:`_default_ssim_fn`.
@@ -101,21 +216,29 @@ def compare_renders(
     Returns
     -------
     list[SSIMResult]
-        One entry per input render.  If no reference image exists the score
-        is 1.0 and ``flagged`` is False (first run establishes the baseline).
+        One entry per input render, in input order.  If no reference image
+        exists the score is 1.0 and ``flagged`` is False (first run
+        establishes the baseline).
     """
     compute = _compute_ssim if _compute_ssim is not None else _default_ssim_fn
     results: list[SSIMResult] = []
+    pending = []  # (index into results, render_path, ref_path, angle)
+
+    # One directory read instead of a stat per render.
+    try:
+        with os.scandir(reference_dir) as entries:
+            ref_paths = {e.name: e.path for e in entries}
+    except OSError:  # missing, not a directory or unreadable: no references yet
+        ref_paths = {}
 
     for render_path in new_renders:
         angle = _parse_angle_from_path(render_path)
         if angle is None:
             continue
 
-        basename = os.path.basename(render_path)
-        ref_path = os.path.join(reference_dir, basename)
+        ref_path = ref_paths.get(os.path.basename(render_path))
 
-        if not os.path.exists(ref_path):
+        if ref_path is None:
             # First run — no golden reference yet; treat as perfect match.
             results.append(SSIMResult(
                 angle=angle,
@@ -125,19 +248,19 @@ def compare_renders(
             ))
             continue
 
-        score, diff_arr = compute(render_path, ref_path)
-        flagged = score < SSIM_THRESHOLD
-
-        diff_path = None
-        if flagged and diff_arr is not None:
-            diff_path = render_path[:-4] + "_diff.png"
-            _save_diff_image(diff_arr, diff_path)
+        pending.append((len(results), render_path, ref_path, angle))
+        results.append(None)  # filled in once scored
 
-        results.append(SSIMResult(
-            angle=angle,
-            score=score,
-            diff_image_path=diff_path,
-            flagged=flagged,
-        ))
+    if max_workers == 1 or len(pending) <= 1:
+        for i, render_path, ref_path, angle in pending:
+            results[i] = _compare_pair(compute, render_path, ref_path, angle)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                (i, pool.submit(_compare_pair, compute, render_path, ref_path, angle))
+                for i, render_path, ref_path, angle in pending
+            ]
+            for i, future in futures:
+                results[i] = future.result()
 
     return results
@@ -1,22 +1,81 @@
 """QA Output Summary."""
 import os
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from html import escape
+from itertools import chain
 
-from pipeline.schema import ReviewFlag, Status
+from pipeline import _fs
+from pipeline.schema import ReviewFlag, StageResult, Status
+
+
+# ---------------------------------------------------------------------------
+# Page template and constants, built once at import and shared by every asset
+# ---------------------------------------------------------------------------
+
+_STATUS_COLOUR = {
+    "PASS": "#27ae60",
+    "PASS_WITH_FIXES": "#2ecc71",
+    "NEEDS_REVIEW": "#e67e22",
+    "FAIL": "#c0392b",
+}
+
+_SEVERITY_COLOUR = {"ERROR": "#c0392b", "WARNING": "#e67e22", "INFO": "#2980b9"}
+
+# ``str.format`` template for everything above the sections; every
+# substituted value is escaped by the caller.  Each section follows on its
+# own line, then ``_PAGE_TAIL``.
+_PAGE_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<title>QA Review &mdash; {asset_id}</title>
+<style>
+  body {{font-family:sans-serif;margin:2em;color:#222;background:#fff}}
+  h1 {{border-bottom:2px solid #ddd;padding-bottom:.4em}}
+  h2 {{color:#444;margin-top:1.6em}}
+  table {{border-collapse:collapse;margin:.5em 0}}
+  th,td {{border:1px solid #ddd;padding:6px 10px;text-align:left;vertical-align:top}}
+  th {{background:#f0f0f0}}
+  .status {{display:inline-block;padding:4px 12px;border-radius:4px;
+            color:#fff;font-weight:bold;background:{status_colour}}}
+  dl {{margin:.5em 0}} dt {{font-weight:bold;float:left;width:12em}} dd {{margin-left:13em}}
+</style>
+</head>
+<body>
+<h1>QA Review &mdash; {asset_id}</h1>
+<p class="status">{status}</p>
+
+<h2>Asset Metadata</h2>
+<dl>
+  <dt>Asset ID</dt><dd>{report_asset_id}</dd>
+  <dt>Source</dt><dd>{report_source}</dd>
+  <dt>Category</dt><dd>{report_category}</dd>
+  <dt>Submitter</dt><dd>{report_submitter}</dd>
+  <dt>Submission Date</dt><dd>{report_submitted}</dd>
+  <dt>Processing Time</dt><dd>{report_processed}</dd>
+</dl>
+
+"""
+
+_PAGE_TAIL = """</body>
+</html>
+"""
 
 
 def _img_tag(src, alt="", style=""):
-    s = f' style="{escape(style)}"' if style else ""
+    # ``style`` is always a literal from this module, so it is not escaped.
+    s = f' style="{style}"' if style else ""
     return f'<img src="{escape(src)}" alt="{escape(alt)}"{s}>'
 
 
 def _flag_row(flag):
-    colour = {"ERROR": "#c0392b", "WARNING": "#e67e22", "INFO": "#2980b9"}
-    bg = colour.get(flag.severity.value, "#555")
+    # Severity is a Status member whose values are plain upper-case words,
+    # safe to emit without escaping.
+    severity = flag.severity.value
+    bg = _SEVERITY_COLOUR.get(severity, "#555")
     badge = (
         f'<span style="background:{bg};color:#fff;padding:2px 6px;'
-        f'border-radius:3px;font-size:0.8em">{escape(flag.severity.value)}</span>'
+        f'border-radius:3px;font-size:0.8em">{severity}</span>'
     )
     return (
         f"<tr><td>{badge}</td>"
@@ -25,115 +84,115 @@ def _flag_row(flag):
     )
 
 
-def _build_html(report, asset_id, render_basenames, scale_basename, ssim_results, diff_basenames, all_flags):
+def _write_html(fh, report, asset_id, render_basenames, scale_basename, ssim_results, diff_basenames, all_flags):
+    """Stream the review page into the binary file *fh*.
+
+    Each section is encoded and written as soon as it is built, so peak
+    memory is one section rather than the whole page plus its encoding.
+    """
+    def write(text):
+        fh.write(text.encode("utf-8"))
+
     status = report.status.value
 
-    status_colour = {
-        "PASS": "#27ae60",
-        "PASS_WITH_FIXES": "#2ecc71",
-        "NEEDS_REVIEW": "#e67e22",
-        "FAIL": "#c0392b",
-    }.get(status, "#555")
-
-    render_cells = "".join(
-        f'<td style="padding:4px;text-align:center">'
-        f'{_img_tag(b, alt=b, style="max-width:200px;max-height:200px;border:1px solid #ddd")}'
-        f'<br><small>{escape(b)}</small></td>'
-        for b in render_basenames
-    )
-    renders_section = (
+    # Each placeholder is filled once, so every value is escaped once; the
+    # package's asset_id is normally the report's own, so share that too.
+    esc_asset = escape(asset_id)
+    write(_PAGE_HEAD.format(
+        asset_id=esc_asset,
+        status=status,
+        status_colour=_STATUS_COLOUR.get(status, "#555"),
+        report_asset_id=esc_asset if report.asset_id == asset_id else escape(report.asset_id),
+        report_source=escape(report.source),
+        report_category=escape(report.category),
+        report_submitter=escape(report.submitter),
+        report_submitted=escape(report.submitted),
+        report_processed=escape(report.processed),
+    ))
+
+    # Rows are appended to a list and joined once; the bound ``append`` avoids
+    # an attribute lookup per row.
+    parts = []
+    append = parts.append
+    for b in render_basenames:
+        b = escape(b)  # once, reused for src, alt and caption
+        append(
+            f'<td style="padding:4px;text-align:center">'
+            f'<img src="{b}" alt="{b}" style="max-width:200px;max-height:200px;border:1px solid #ddd">'
+            f'<br><small>{b}</small></td>'
+        )
+    render_cells = "".join(parts)
+    write(
         f"<h2>Turntable Renders</h2>"
-        f'<table><tr>{render_cells}</tr></table>'
+        f'<table><tr>{render_cells}</tr></table>\n'
         if render_cells
-        else "<h2>Turntable Renders</h2><p>No renders available.</p>"
+        else "<h2>Turntable Renders</h2><p>No renders available.</p>\n"
     )
 
     if scale_basename:
-        scale_section = (
+        write(
             f"<h2>Scale Reference</h2>"
-            f'<p>{_img_tag(scale_basename, alt="Scale reference", style="max-width:600px;border:1px solid #ddd")}</p>'
-        )
-    else:
-        scale_section = "<h2>Scale Reference</h2><p>Not available.</p>"
-
-    if diff_basenames:
-        diff_cells = "".join(
-            f'<td style="padding:4px;text-align:center">'
-            f'{_img_tag(b, alt=b, style="max-width:200px;max-height:200px;border:1px solid #c0392b")}'
-            f'<br><small>{escape(b)}</small></td>'
-            for b in diff_basenames
+            f'<p>{_img_tag(scale_basename, alt="Scale reference", style="max-width:600px;border:1px solid #ddd")}</p>\n'
         )
-        diffs_section = f"<h2>SSIM Diff Images (Flagged)</h2><table><tr>{diff_cells}</tr></table>"
     else:
-        diffs_section = ""
+        write("<h2>Scale Reference</h2><p>Not available.</p>\n")
 
     if ssim_results:
-        score_rows = "".join(
-            f"<tr>"
-            f"<td>{r['angle']}&deg;</td>"
-            f"<td>{r['score']:.4f}</td>"
-            f'<td style="color:{"#c0392b" if r["flagged"] else "#27ae60"}">'
-            f'{"&#x26A0; FLAGGED" if r["flagged"] else "OK"}</td>'
-            f"</tr>"
-            for r in ssim_results
-        )
-        ssim_section = (
+        parts = []
+        append = parts.append
+        for r in ssim_results:
+            append(
+                f"<tr>"
+                f"<td>{r['angle']}&deg;</td>"
+                f"<td>{r['score']:.4f}</td>"
+                f'<td style="color:{"#c0392b" if r["flagged"] else "#27ae60"}">'
+                f'{"&#x26A0; FLAGGED" if r["flagged"] else "OK"}</td>'
+                f"</tr>"
+            )
+        score_rows = "".join(parts)
+        write(
             f"<h2>SSIM Scores</h2>"
             f"<table><tr><th>Angle</th><th>Score</th><th>Status</th></tr>"
-            f"{score_rows}</table>"
+            f"{score_rows}</table>\n"
         )
     else:
-        ssim_section = ""
+        write("\n")
+
+    if diff_basenames:
+        parts = []
+        append = parts.append
+        for b in diff_basenames:
+            b = escape(b)
+            append(
+                f'<td style="padding:4px;text-align:center">'
+                f'<img src="{b}" alt="{b}" style="max-width:200px;max-height:200px;border:1px solid #c0392b">'
+                f'<br><small>{b}</small></td>'
+            )
+        diff_cells = "".join(parts)
+        write(f"<h2>SSIM Diff Images (Flagged)</h2><table><tr>{diff_cells}</tr></table>\n")
+    else:
+        write("\n")
 
     if all_flags:
-        flag_rows = "".join(_flag_row(f) for f in all_flags)
-        flags_section = (
+        flag_rows = "".join([_flag_row(f) for f in all_flags])
+        write(
             f"<h2>Review Flags</h2>"
             f"<table><tr><th>Severity</th><th>Issue</th><th>Description</th></tr>"
-            f"{flag_rows}</table>"
+            f"{flag_rows}</table>\n"
         )
     else:
-        flags_section = "<h2>Review Flags</h2><p>None.</p>"
+        write("<h2>Review Flags</h2><p>None.</p>\n")
 
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<title>QA Review &mdash; {escape(asset_id)}</title>
-<style>
-  body {{font-family:sans-serif;margin:2em;color:#222;background:#fff}}
-  h1 {{border-bottom:2px solid #ddd;padding-bottom:.4em}}
-  h2 {{color:#444;margin-top:1.6em}}
-  table {{border-collapse:collapse;margin:.5em 0}}
-  th,td {{border:1px solid #ddd;padding:6px 10px;text-align:left;vertical-align:top}}
-  th {{background:#f0f0f0}}
-  .status {{display:inline-block;padding:4px 12px;border-radius:4px;
-            color:#fff;font-weight:bold;background:{status_colour}}}
-  dl {{margin:.5em 0}} dt {{font-weight:bold;float:left;width:12em}} dd {{margin-left:13em}}
-</style>
-</head>
-<body>
-<h1>QA Review &mdash; {escape(asset_id)}</h1>
-<p class="status">{escape(status)}</p>
+    write(_PAGE_TAIL)
 
-<h2>Asset Metadata</h2>
-<dl>
-  <dt>Asset ID</dt><dd>{escape(report.asset_id)}</dd>
-  <dt>Source</dt><dd>{escape(report.source)}</dd>
-  <dt>Category</dt><dd>{escape(report.category)}</dd>
-  <dt>Submitter</dt><dd>{escape(report.submitter)}</dd>
-  <dt>Submission Date</dt><dd>{escape(report.submitted)}</dd>
-  <dt>Processing Time</dt><dd>{escape(report.processed)}</dd>
-</dl>
 
-{renders_section}
-{scale_section}
-{ssim_section}
-{diffs_section}
-{flags_section}
-</body>
-</html>
-"""
+def _stat_or_none(path):
+    # One stat per source: it doubles as the existence check and supplies
+    # the mode and timestamps fast_copy applies to the copy.
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
 
 
 def write_review_package(report, render_paths, ssim_results, scale_image, output_dir):
@@ -141,24 +200,53 @@ def write_review_package(report, render_paths, ssim_results, scale_image, output
     package_dir = os.path.join(output_dir, asset_id)
     os.makedirs(package_dir, exist_ok=True)
 
+    # dst -> (src, st).  Keyed by destination so a repeated basename is
+    # copied once, with the last source winning as it did when copied serially.
+    copies = {}
+
+    # A basename never contains a separator, so joining onto the package dir
+    # reduces to concatenation with a prefix that ends in one.
+    pkg = os.path.join(package_dir, "")
+
+    def _queue(src, st):
+        bn = os.path.basename(src)
+        copies[pkg + bn] = (src, st)
+        return bn
+
     render_basenames = []
     for render_path in render_paths:
-        if os.path.exists(render_path):
-            bn = os.path.basename(render_path)
-            shutil.copy2(render_path, os.path.join(package_dir, bn))
-            render_basenames.append(bn)
+        st = _stat_or_none(render_path)
+        if st is not None:
+            render_basenames.append(_queue(render_path, st))
 
     diff_basenames = []
     for r in ssim_results:
-        if r["diff_image_path"] and os.path.exists(r["diff_image_path"]):
-            bn = os.path.basename(r["diff_image_path"])
-            shutil.copy2(r["diff_image_path"], os.path.join(package_dir, bn))
-            diff_basenames.append(bn)
+        diff_path = r["diff_image_path"]
+        if diff_path:
+            st = _stat_or_none(diff_path)
+            if st is not None:
+                diff_basenames.append(_queue(diff_path, st))
 
     scale_basename = None
-    if scale_image and os.path.exists(scale_image):
-        scale_basename = os.path.basename(scale_image)
-        shutil.copy2(scale_image, os.path.join(package_dir, scale_basename))
+    if scale_image:
+        st = _stat_or_none(scale_image)
+        if st is not None:
+            scale_basename = _queue(scale_image, st)
+
+    # The copies are independent and each writes its own destination, so
+    # run them concurrently; the GIL is released inside the copy syscalls.
+    if copies:
+        with ThreadPoolExecutor(max_workers=min(8, len(copies))) as pool:
+            futures = [
+                pool.submit(_fs.fast_copy, src, dst, st)
+                for dst, (src, st) in copies.items()
+            ]
+            for future in futures:
+                future.result()
+
+    # Flags from the stages run so far, collected before the visual
+    # verification stage is appended so the stage list is walked once.
+    all_flags = list(chain.from_iterable(stage.flags for stage in report.stages))
 
     stage5_flags = [ReviewFlag(
         issue="scale_verification",
@@ -166,27 +254,22 @@ def write_review_package(report, render_paths, ssim_results, scale_image, output
         description="Scale reference screenshot generated. Human reviewer must verify scale is correct.",
     )]
     # Append a pseudo-stage for visual verification flags
-    report.stages.append(type('_Stage', (), {
-        'name': 'visual_verification',
-        'status': Status.PASS,
-        'checks': [],
-        'fixes': [],
-        'flags': stage5_flags,
-    })())
-
-    all_flags = []
-    for stage in report.stages:
-        all_flags.extend(stage.flags)
-
-    html = _build_html(
-        report=report,
-        asset_id=asset_id,
-        render_basenames=render_basenames,
-        scale_basename=scale_basename,
-        ssim_results=ssim_results,
-        diff_basenames=diff_basenames,
-        all_flags=all_flags,
-    )
+    report.stages.append(StageResult(
+        name="visual_verification",
+        status=Status.PASS,
+        flags=stage5_flags,
+    ))
+    all_flags.extend(stage5_flags)
+
     html_path = os.path.join(package_dir, "review_summary.html")
-    with open(html_path, "w", encoding="utf-8") as fh:
-        fh.write(html)
+    with open(html_path, "wb") as fh:
+        _write_html(
+            fh,
+            report=report,
+            asset_id=asset_id,
+            render_basenames=render_basenames,
+            scale_basename=scale_basename,
+            ssim_results=ssim_results,
+            diff_basenames=diff_basenames,
+            all_flags=all_flags,
+        )
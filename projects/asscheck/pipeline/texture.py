@@ -7,6 +7,7 @@ count per material, channel count/bit depth, and color space assignment.
 """
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 
 from pipeline.schema import CheckResult, StageResult, Status
@@ -60,6 +61,37 @@ class ImageTextureNode:
     image_name: str
     filepath_missing: bool
 
+
+# Violation records stored in ``CheckResult.value``.  Slotted frozen
+# dataclasses are smaller and cheaper to build than the equivalent dicts;
+# the report serialisers turn them into the same JSON objects.
+
+@dataclass(frozen=True, slots=True)
+class ResolutionViolation:
+    name: str
+    size: tuple[int, int]
+    limit: int
+
+
+@dataclass(frozen=True, slots=True)
+class PowerOfTwoViolation:
+    name: str
+    size: tuple[int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class DepthViolation:
+    name: str
+    depth: int
+
+
+@dataclass(frozen=True, slots=True)
+class ColorSpaceViolation:
+    name: str
+    expected: str
+    actual: str
+
+
 _SRGB_KEYWORDS = (
     "albedo", "diffuse", "color", "colour", "basecolor", "base_color",
 )
@@ -68,6 +100,11 @@ _LINEAR_KEYWORDS = (
     "ao", "ambient_occlusion", "specular", "height", "bump", "displacement",
 )
 
+# One alternation per keyword set: a single scan of the name replaces one
+# substring search per keyword.
+_SRGB_RE = re.compile("|".join(map(re.escape, _SRGB_KEYWORDS)))
+_LINEAR_RE = re.compile("|".join(map(re.escape, _LINEAR_KEYWORDS)))
+
 def _infer_expected_colorspace(socket_name, image_name):
     """Infer expected color space from socket and image name keywords.
 
@@ -75,12 +112,10 @@ def _infer_expected_colorspace(socket_name, image_name):
     Socket name is checked before image name so explicit wiring takes priority.
     """
     for text in (socket_name.lower(), image_name.lower()):
-        for kw in _SRGB_KEYWORDS:
-            if kw in text:
-                return "sRGB"
-        for kw in _LINEAR_KEYWORDS:
-            if kw in text:
-                return "Non-Color"
+        if _SRGB_RE.search(text):
+            return "sRGB"
+        if _LINEAR_RE.search(text):
+            return "Non-Color"
     return None
 
 # ---------------------------------------------------------------------------
@@ -88,12 +123,12 @@ def _infer_expected_colorspace(socket_name, image_name):
 # ---------------------------------------------------------------------------
 
 def _check_missing_textures(
-    materials: list[TextureMaterial],
+    node_lists: list[list[ImageTextureNode]],
 ) -> CheckResult:
     broken = sum(
         1
-        for mat in materials
-        for node in mat.image_texture_nodes()
+        for nodes in node_lists
+        for node in nodes
         if node.filepath_missing
     )
     return CheckResult(
@@ -112,17 +147,18 @@ def _is_power_of_two(n):
 
 def _check_resolution_limit(
     images: list[TextureImage],
+    sizes: list[tuple[int, int]],
     config: TextureConfig,
 ) -> CheckResult:
     limit = (
         config.max_resolution_hero if config.is_hero_asset
         else config.max_resolution_standard
     )
-    violations = []
-    for img in images:
-        w, h = img.size
-        if w > limit or h > limit:
-            violations.append({"name": img.name, "size": [w, h], "limit": limit})
+    violations = [
+        ResolutionViolation(images[i].name, (w, h), limit)
+        for i, (w, h) in enumerate(sizes)
+        if w > limit or h > limit
+    ]
     return CheckResult(
         name="resolution_limit",
         status=Status.FAIL if violations else Status.PASS,
@@ -136,12 +172,13 @@ def _check_resolution_limit(
 
 def _check_power_of_two(
     images: list[TextureImage],
+    sizes: list[tuple[int, int]],
 ) -> CheckResult:
-    violations = []
-    for img in images:
-        w, h = img.size
-        if not (_is_power_of_two(w) and _is_power_of_two(h)):
-            violations.append({"name": img.name, "size": [w, h]})
+    violations = [
+        PowerOfTwoViolation(images[i].name, (w, h))
+        for i, (w, h) in enumerate(sizes)
+        if not (_is_power_of_two(w) and _is_power_of_two(h))
+    ]
     return CheckResult(
         name="power_of_two",
         status=Status.FAIL if violations else Status.PASS,
@@ -155,15 +192,14 @@ def _check_power_of_two(
 
 def _check_texture_count(
     materials: list[TextureMaterial],
+    node_lists: list[list[ImageTextureNode]],
     config: TextureConfig,
 ) -> CheckResult:
-    worst_count = 0
-    worst_mat = ""
-    for mat in materials:
-        count = len(mat.image_texture_nodes())
-        if count > worst_count:
-            worst_count = count
-            worst_mat = mat.name
+    # max() and index() both run in C; index() picks the first material with
+    # the top count, and no material is named while every count is zero.
+    counts = list(map(len, node_lists))
+    worst_count = max(counts, default=0)
+    worst_mat = materials[counts.index(worst_count)].name if worst_count else ""
     failed = worst_count > config.max_textures_per_material
     return CheckResult(
         name="texture_count",
@@ -183,11 +219,11 @@ _STANDARD_DEPTHS: frozenset[int] = frozenset({24, 32})
 def _check_channel_depth(
     images: list[TextureImage],
 ) -> CheckResult:
-    flagged = [
-        {"name": img.name, "depth": img.depth}
-        for img in images
-        if img.depth not in _STANDARD_DEPTHS
-    ]
+    flagged = []
+    for img in images:
+        depth = img.depth  # a bpy property read on the Blender wrapper; once
+        if depth not in _STANDARD_DEPTHS:
+            flagged.append(DepthViolation(img.name, depth))
     return CheckResult(
         name="channel_depth",
         status=Status.WARNING if flagged else Status.PASS,
@@ -201,15 +237,22 @@ def _check_channel_depth(
     )
 
 def _check_color_space(
-    materials: list[TextureMaterial],
+    node_lists: list[list[ImageTextureNode]],
     images: list[TextureImage],
 ) -> CheckResult:
     image_by_name = {img.name: img for img in images}
     violations = []
-
-    for mat in materials:
-        for node in mat.image_texture_nodes():
-            expected = _infer_expected_colorspace(node.socket_name, node.image_name)
+    # Shared textures repeat the same (socket, image) pair across materials;
+    # infer each distinct pair once rather than re-lowering and re-scanning.
+    expected_by_key: dict[tuple[str, str], str | None] = {}
+
+    for nodes in node_lists:
+        for node in nodes:
+            key = (node.socket_name, node.image_name)
+            try:
+                expected = expected_by_key[key]
+            except KeyError:
+                expected = expected_by_key[key] = _infer_expected_colorspace(*key)
             if expected is None:
                 continue  # Cannot infer map type — skip
             img = image_by_name.get(node.image_name)
@@ -220,18 +263,14 @@ def _check_color_space(
             if expected == "Non-Color":
                 # Both "Non-Color" and "Linear" are acceptable for linear maps.
                 if actual not in ("Non-Color", "Linear"):
-                    violations.append({
-                        "name": node.image_name,
-                        "expected": "Non-Color",
-                        "actual": actual,
-                    })
+                    violations.append(
+                        ColorSpaceViolation(node.image_name, "Non-Color", actual)
+                    )
             else:
                 if actual != expected:
-                    violations.append({
-                        "name": node.image_name,
-                        "expected": expected,
-                        "actual": actual,
-                    })
+                    violations.append(
+                        ColorSpaceViolation(node.image_name, expected, actual)
+                    )
 
     return CheckResult(
         name="color_space",
@@ -260,14 +299,19 @@ def check_textures(
     """
     materials = context.materials()
     images = context.images()
+    # Read every image size once, as a column parallel to ``images``; both
+    # dimension checks scan it and only touch ``images`` for violations.
+    sizes = [img.size for img in images]
+    # Likewise walk each material's node tree once, parallel to ``materials``.
+    node_lists = [mat.image_texture_nodes() for mat in materials]
 
     checks = [
-        _check_missing_textures(materials),
-        _check_resolution_limit(images, config),
-        _check_power_of_two(images),
-        _check_texture_count(materials, config),
+        _check_missing_textures(node_lists),
+        _check_resolution_limit(images, sizes, config),
+        _check_power_of_two(images, sizes),
+        _check_texture_count(materials, node_lists, config),
         _check_channel_depth(images),
-        _check_color_space(materials, images),
+        _check_color_space(node_lists, images),
     ]
 
     stage_status = (
@@ -46,6 +46,10 @@ class TurntableConfig:
         ``"EEVEE"`` or ``"CYCLES"`` (default ``"EEVEE"``).
     samples:
         Render sample count (default 32).
+    png_compression:
+        PNG compression level 0-100 (Blender's default is 15).  Encoding runs
+        synchronously after each render, so lower values shorten the gap
+        between shots at the cost of larger files.
     """
     num_angles: int = 8
     camera_distance: float = 2.5
@@ -53,6 +57,7 @@ class TurntableConfig:
     resolution: tuple[int, int] = field(default_factory=lambda: (1024, 1024))
     engine: str = "EEVEE"
     samples: int = 32
+    png_compression: int = 15
 
 
 # ---------------------------------------------------------------------------
@@ -83,40 +88,49 @@ def _get_scene_bounds():
     """Return (centre, radius) for all mesh objects in the scene."""
     import bpy  # noqa: PLC0415
     import mathutils
+    import numpy as np
 
-    INF = float("inf")
-    min_co = [INF, INF, INF]
-    max_co = [-INF, -INF, -INF]
-    found = False
-
-    for obj in bpy.context.scene.objects:
-        if obj.type == "MESH":
-            found = True
-            for corner in obj.bound_box:
-                world = obj.matrix_world @ mathutils.Vector(corner)
-                for i in range(3):
-                    min_co[i] = min(min_co[i], world[i])
-                    max_co[i] = max(max_co[i], world[i])
-
-    if not found:
+    objects = bpy.context.scene.objects
+    n = len(objects)
+    # ``type`` is an enum, which foreach_get cannot read; one pass builds the
+    # mesh mask and the numeric properties below are bulk-copied.
+    is_mesh = np.fromiter(
+        (obj.type == "MESH" for obj in objects), dtype=bool, count=n,
+    )
+
+    if not is_mesh.any():
         centre = mathutils.Vector((0.0, 0.0, 0.0))
         radius = 1.0
     else:
-        centre = mathutils.Vector(
-            ((min_co[i] + max_co[i]) * 0.5 for i in range(3))
-        )
-        diag = mathutils.Vector(
-            (max_co[i] - min_co[i] for i in range(3))
-        )
-        radius = diag.length * 0.5
+        # Every object's 8 local bound-box corners and world matrix, each
+        # copied out of Blender in a single foreach_get call (float32 is
+        # Blender's own storage), then one batched transform and reduction.
+        corners = np.empty(n * 24, dtype=np.float32)
+        objects.foreach_get("bound_box", corners)
+        corners = corners.reshape(n, 8, 3)[is_mesh].astype(np.float64)
+        # foreach_get flattens matrices column by column, so each (4, 4)
+        # block is the transpose: rows 0-2 hold the rotation/scale columns
+        # and row 3 the translation.  world = corners @ R.T + t then needs
+        # no transpose and no homogeneous copy of the corners.
+        mats_t = np.empty(n * 16, dtype=np.float32)
+        objects.foreach_get("matrix_world", mats_t)
+        mats_t = mats_t.reshape(n, 4, 4)[is_mesh].astype(np.float64)
+        world = corners @ mats_t[:, :3, :3]
+        world += mats_t[:, None, 3, :3]
+        min_co = world.min(axis=(0, 1))
+        max_co = world.max(axis=(0, 1))
+
+        centre = mathutils.Vector((min_co + max_co) * 0.5)
+        radius = float(np.linalg.norm(max_co - min_co)) * 0.5
 
     return centre, max(radius, 0.01)
 
 
-def _setup_camera(x, y, z, target):
-    """Position the scene camera at (x, y, z) pointing towards *target*."""
+def _ensure_camera():
+    """Return the QA turntable camera, creating it if needed, and make it
+    the scene camera.
+    """
     import bpy  # noqa: PLC0415
-    import mathutils
 
     cam_name = "QATurntableCamera"
     if cam_name not in bpy.data.cameras:
@@ -130,11 +144,18 @@ def _setup_camera(x, y, z, target):
     else:
         cam_obj = bpy.data.objects[cam_name]
 
+    bpy.context.scene.camera = cam_obj
+    return cam_obj
+
+
+def _aim_camera(cam_obj, x, y, z, target):
+    """Position *cam_obj* at (x, y, z) pointing towards *target*."""
+    import mathutils
+
     cam_obj.location = (x, y, z)
     direction = mathutils.Vector(target) - mathutils.Vector((x, y, z))
     rot_quat = direction.to_track_quat("-Z", "Y")
     cam_obj.rotation_euler = rot_quat.to_euler()
-    bpy.context.scene.camera = cam_obj
 
 
 def _setup_lighting():
@@ -191,6 +212,11 @@ def _setup_render_settings(config: TurntableConfig):
     scene.render.resolution_x = config.resolution[0]
     scene.render.resolution_y = config.resolution[1]
     scene.render.image_settings.file_format = "PNG"
+    scene.render.image_settings.compression = config.png_compression
+    # Only the camera moves between shots, so keep Cycles' synced scene data
+    # (including the BVH) alive across renders instead of rebuilding it for
+    # every angle.  EEVEE ignores this setting.
+    scene.render.use_persistent_data = True
 
     if config.engine == "CYCLES":
         scene.render.engine = "CYCLES"
@@ -208,6 +234,66 @@ def _setup_render_settings(config: TurntableConfig):
                 scene.eevee.taa_render_samples = config.samples
 
 
+def _prepare_scene(asset_path, config: TurntableConfig):
+    """Reset Blender, load the asset, and apply lighting and render settings."""
+    import bpy  # noqa: PLC0415
+
+    # Start from a clean scene
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+
+    _import_asset(asset_path)
+    _setup_lighting()
+    _setup_render_settings(config)
+
+
+def _angle_path(output_dir, asset_id, angle_deg):
+    """Return the PNG path for one turntable shot."""
+    return os.path.join(
+        output_dir,
+        f"{asset_id}_turntable_{int(angle_deg):03d}.png",
+    )
+
+
+def _render_angles(asset_path, output_dir, config, indices):
+    """Render the shots at *indices* into the already-loaded scene."""
+    import bpy  # noqa: PLC0415
+    import numpy as np
+
+    centre, radius = _get_scene_bounds()
+    asset_id = Path(asset_path).stem
+    os.makedirs(output_dir, exist_ok=True)
+
+    angle_step = 360.0 / config.num_angles
+    elev_rad = math.radians(config.camera_elevation)
+    dist = config.camera_distance + radius
+
+    # Every camera position up front.  Each shot depends only on its own
+    # index, so a worker rendering a subset places its cameras exactly where
+    # a single-process run would.
+    angles_deg = np.asarray(indices, dtype=np.float64) * angle_step
+    az_rad = np.radians(angles_deg)
+    ring = dist * math.cos(elev_rad)
+    cam_xs = centre.x + ring * np.cos(az_rad)
+    cam_ys = centre.y + ring * np.sin(az_rad)
+    cam_z = centre.z + dist * math.sin(elev_rad)
+
+    # Look the camera up once; the loop only moves it.
+    cam_obj = _ensure_camera()
+
+    rendered = []
+    for angle_deg, cam_x, cam_y in zip(
+        angles_deg.tolist(), cam_xs.tolist(), cam_ys.tolist(),
+    ):
+        _aim_camera(cam_obj, cam_x, cam_y, cam_z, centre)
+
+        out_path = _angle_path(output_dir, asset_id, angle_deg)
+        bpy.context.scene.render.filepath = out_path
+        bpy.ops.render.render(write_still=True)
+        rendered.append(out_path)
+
+    return rendered
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -233,46 +319,98 @@ def render_turntable(
     list[str]
         Absolute paths to all rendered PNG files.
     """
-    import bpy  # noqa: PLC0415
-
     if config is None:
         config = TurntableConfig()
 
-    # Start from a clean scene
-    bpy.ops.wm.read_factory_settings(use_empty=True)
+    _prepare_scene(asset_blend_or_gltf, config)
+    return _render_angles(
+        asset_blend_or_gltf, output_dir, config, range(config.num_angles),
+    )
 
-    _import_asset(asset_blend_or_gltf)
-    _setup_lighting()
-    _setup_render_settings(config)
 
-    centre, radius = _get_scene_bounds()
-    asset_id = Path(asset_blend_or_gltf).stem
-    os.makedirs(output_dir, exist_ok=True)
+def render_turntable_parallel(
+    asset_blend_or_gltf,
+    output_dir,
+    config: TurntableConfig | None = None,
+    *,
+    workers: int | None = None,
+    blender: str = "blender",
+) -> list[str]:
+    """Render turntable views across several headless Blender processes.
 
-    angle_step = 360.0 / config.num_angles
-    elev_rad = math.radians(config.camera_elevation)
-    dist = config.camera_distance + radius
+    Unlike :func:`render_turntable` this runs **outside** Blender: the angles
+    are dealt round-robin to *workers* ``blender --background`` processes,
+    each of which loads the asset once and renders its share.  The shots are
+    independent, so this scales with the cores/GPUs left idle by a single
+    render process, at the cost of one scene load per worker.
 
-    rendered = []
-    for i in range(config.num_angles):
-        angle_deg = i * angle_step
-        az_rad = math.radians(angle_deg)
+    Parameters
+    ----------
+    workers:
+        Number of Blender processes; defaults to 2, capped at
+        ``config.num_angles``.  Each process renders multithreaded and holds
+        its own copy of the scene, so keep this small.
+    blender:
+        Blender executable to launch.
+
+    Returns
+    -------
+    list[str]
+        Absolute paths to all rendered PNG files, in angle order.
 
-        cam_x = centre.x + dist * math.cos(elev_rad) * math.cos(az_rad)
-        cam_y = centre.y + dist * math.cos(elev_rad) * math.sin(az_rad)
-        cam_z = centre.z + dist * math.sin(elev_rad)
+    Raises
+    ------
+    RuntimeError
+        If any Blender worker exits non-zero or a shot was not written.
+    """
+    import json  # noqa: PLC0415
+    import subprocess  # noqa: PLC0415
+    from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+    from dataclasses import asdict  # noqa: PLC0415
 
-        _setup_camera(cam_x, cam_y, cam_z, centre)
+    if config is None:
+        config = TurntableConfig()
 
-        out_path = os.path.join(
-            output_dir,
-            f"{asset_id}_turntable_{int(angle_deg):03d}.png",
-        )
-        bpy.context.scene.render.filepath = out_path
-        bpy.ops.render.render(write_still=True)
-        rendered.append(out_path)
+    workers = min(workers or 2, config.num_angles)
+    chunks = [
+        list(range(w, config.num_angles, workers)) for w in range(workers)
+    ]
+    base_cmd = [
+        # Without --python-exit-code Blender exits 0 even if the script raises.
+        blender, "--background", "--python-exit-code", "1",
+        "--python", os.path.abspath(__file__), "--",
+        os.fspath(asset_blend_or_gltf), os.fspath(output_dir),
+        "--config", json.dumps(asdict(config)),
+    ]
 
-    return rendered
+    def _run(chunk):
+        cmd = base_cmd + ["--angles", ",".join(map(str, chunk))]
+        # Threads only wait on the child processes, so no pickling is needed.
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"Blender exited with code {result.returncode}.\n"
+                f"stderr:\n{result.stderr}"
+            )
+
+    os.makedirs(output_dir, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(_run, chunk) for chunk in chunks]:
+            future.result()
+
+    asset_id = Path(asset_blend_or_gltf).stem
+    angle_step = 360.0 / config.num_angles
+    paths = [
+        _angle_path(output_dir, asset_id, i * angle_step)
+        for i in range(config.num_angles)
+    ]
+    missing = [p for p in paths if not os.path.exists(p)]
+    if missing:
+        raise RuntimeError(
+            f"{len(missing)} turntable shot(s) were not rendered:\n"
+            + "\n".join(missing)
+        )
+    return paths
 
 
 # ---------------------------------------------------------------------------
@@ -285,17 +423,46 @@ if __name__ == "__main__":
     if len(custom_args) < 2:
         print(
             "Usage: blender --background --python pipeline/turntable.py"
-            " -- <asset_path> <output_dir> [num_angles]",
+            " -- <asset_path> <output_dir> [num_angles]"
+            " [--config <json>] [--angles i,j,...]",
             file=sys.stderr,
         )
         sys.exit(1)
 
-    asset_path_arg = custom_args[0]
-    output_dir_arg = custom_args[1]
-    cfg = TurntableConfig()
-    if len(custom_args) >= 3:
-        cfg.num_angles = int(custom_args[2])
+    # ``--config`` and ``--angles`` are passed by render_turntable_parallel
+    # to have a worker render only its share of the shots.
+    angles_arg = None
+    config_arg = None
+    positional = []
+    it = iter(custom_args)
+    for arg in it:
+        if arg == "--angles":
+            angles_arg = next(it)
+        elif arg == "--config":
+            config_arg = next(it)
+        else:
+            positional.append(arg)
+
+    asset_path_arg = positional[0]
+    output_dir_arg = positional[1]
+    if config_arg is not None:
+        import json
+
+        cfg_fields = json.loads(config_arg)
+        cfg_fields["resolution"] = tuple(cfg_fields["resolution"])
+        cfg = TurntableConfig(**cfg_fields)
+    else:
+        cfg = TurntableConfig()
+    if len(positional) >= 3:
+        cfg.num_angles = int(positional[2])
 
-    paths = render_turntable(asset_path_arg, output_dir_arg, cfg)
+    if angles_arg is None:
+        paths = render_turntable(asset_path_arg, output_dir_arg, cfg)
+    else:
+        _prepare_scene(asset_path_arg, cfg)
+        paths = _render_angles(
+            asset_path_arg, output_dir_arg, cfg,
+            [int(a) for a in angles_arg.split(",")],
+        )
     for p in paths:
         print(f"Rendered: {p}")
@@ -7,15 +7,18 @@ lightmap UV2 issues.
 """
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 
+import numpy as np
+
 from pipeline.schema import CheckResult, StageResult, Status
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UVConfig:
     """Configuration for UV checks.
 
@@ -38,97 +41,244 @@ class UVConfig:
     uv_layer_name: str = "UVMap"
     lightmap_layer_name: str = "UVMap2"
 
+
+# Stored in the ``texel_density`` and ``lightmap_uv2`` ``CheckResult.value``.
+# The report serialisers turn them into the same JSON objects as the dicts
+# they replace.
+
+@dataclass(frozen=True, slots=True)
+class TexelDensityStats:
+    min: float
+    max: float
+    mean: float
+    outlier_count: int
+
+
+@dataclass(frozen=True, slots=True)
+class LightmapStats:
+    present: bool
+    overlap_count: int
+
+# ---------------------------------------------------------------------------
+# Overlap detection
+# ---------------------------------------------------------------------------
+#
+# Triangles are stored as one contiguous ``(N, 6)`` float32 array (see
+# ``_gather_triangles``) and widened to an ``(N, 3, 2)`` float64 view for
+# testing.  Every kernel below works on whole batches of candidate pairs at
+# once, so the per-pair cost is NumPy's C loops rather than interpreter
+# dispatch.  The arithmetic is the
+# scalar formulation evaluated in the same order, so results are bit-for-bit
+# those of a per-pair Python loop.
+
 def _cross_2d(o, a, b):
-    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+    return (
+        (a[..., 0] - o[..., 0]) * (b[..., 1] - o[..., 1])
+        - (a[..., 1] - o[..., 1]) * (b[..., 0] - o[..., 0])
+    )
 
 def _segments_intersect(a0, a1, b0, b1):
-    """Return True if segments a0-a1 and b0-b1 properly intersect."""
+    """Element-wise: True where segments a0-a1 and b0-b1 properly intersect."""
     d1 = _cross_2d(b0, b1, a0)
     d2 = _cross_2d(b0, b1, a1)
     d3 = _cross_2d(a0, a1, b0)
     d4 = _cross_2d(a0, a1, b1)
-    return (
-        ((d1 > 0 and d2 < 0) or (d1 < 0 and d2 > 0))
-        and ((d3 > 0 and d4 < 0) or (d3 < 0 and d4 > 0))
-    )
+    # Opposite strict signs <=> negative product.  The cross products of
+    # float32-sourced UVs are bounded far away from float64 underflow, so the
+    # product is never flushed to zero and this matches the four-way sign test.
+    return (d1 * d2 < 0.0) & (d3 * d4 < 0.0)
 
 def _point_in_triangle(p, t0, t1, t2):
-    """Return True if point p lies inside (or on the boundary of) triangle t0-t1-t2."""
+    """Element-wise: True where p lies inside (or on the boundary of) t0-t1-t2."""
     d0 = _cross_2d(t0, t1, p)
     d1 = _cross_2d(t1, t2, p)
     d2 = _cross_2d(t2, t0, p)
-    has_neg = (d0 < 0) or (d1 < 0) or (d2 < 0)
-    has_pos = (d0 > 0) or (d1 > 0) or (d2 > 0)
-    return not (has_neg and has_pos)
+    has_neg = (d0 < 0) | (d1 < 0) | (d2 < 0)
+    has_pos = (d0 > 0) | (d1 > 0) | (d2 > 0)
+    return ~(has_neg & has_pos)
 
-def _triangles_overlap(t1, t2):
-    """Exact 2-D triangle-triangle overlap test.
+def _precompute_edges(tris):
+    """Directed edges of an ``(N, 3, 2)`` triangle array, as ``(N, 3, 2, 2)``.
 
-    Returns True if the triangles share any interior area (edge crossings or
-    containment).
+    ``edges[:, i, 0]`` is vertex ``i`` and ``edges[:, i, 1]`` vertex
+    ``(i + 1) % 3``, so ``edges[:, :, 0]`` is the triangle itself.
     """
-    v1 = [t1[0], t1[1], t1[2]]
-    v2 = [t2[0], t2[1], t2[2]]
-
-    # Check all edge pairs for intersection.
-    for i in range(3):
-        for j in range(3):
-            if _segments_intersect(
-                v1[i], v1[(i + 1) % 3], v2[j], v2[(j + 1) % 3]
-            ):
-                return True
-
-    # Check containment (one triangle entirely inside the other).
-    if _point_in_triangle(v1[0], *v2):
-        return True
-    if _point_in_triangle(v2[0], *v1):
-        return True
+    return np.stack([tris, tris[:, [1, 2, 0]]], axis=2)
 
-    return False
+def _triangles_overlap(e1, e2):
+    """Exact 2-D triangle-triangle overlap test over ``(P, 3, 2, 2)`` batches
+    of directed edges (see ``_precompute_edges``).
 
-def _triangle_aabb(tri):
-    xs = (tri[0][0], tri[1][0], tri[2][0])
-    ys = (tri[0][1], tri[1][1], tri[2][1])
-    return min(xs), min(ys), max(xs), max(ys)
+    Returns a ``(P,)`` bool array, True where the triangles share any
+    interior area (edge crossings or containment).
+    """
+    # All 3x3 edge pairs at once: edges of t1 along axis 1, of t2 along axis 2.
+    a0 = e1[:, :, None, 0]
+    a1 = e1[:, :, None, 1]
+    b0 = e2[:, None, :, 0]
+    b1 = e2[:, None, :, 1]
+    hit = _segments_intersect(a0, a1, b0, b1).any(axis=(1, 2))
+
+    # Containment (one triangle entirely inside the other).
+    t1 = e1[:, :, 0]
+    t2 = e2[:, :, 0]
+    hit |= _point_in_triangle(t1[:, 0], t2[:, 0], t2[:, 1], t2[:, 2])
+    hit |= _point_in_triangle(t2[:, 0], t1[:, 0], t1[:, 1], t1[:, 2])
+    return hit
+
+def _triangle_areas_2d(tris):
+    """Areas of an ``(N, 6)`` triangle array, as an ``(N,)`` float64 array."""
+    t = tris.astype(np.float64)
+    x0, y0, x1, y1, x2, y2 = t.T
+    return np.abs((x1 - x0) * (y2 - y0) - (x2 - x0) * (y1 - y0)) / 2.0
+
+def _uv_triangle_array(obj, layer_name):
+    """Return *obj*'s UV triangles on *layer_name* as ``(N, 6)`` float32.
+
+    Columns are ``x0, y0, x1, y1, x2, y2``.  Blender stores UVs as float32,
+    so the packing is lossless; kernels widen to float64 before arithmetic.
+    """
+    return np.asarray(obj.uv_triangles(layer_name), dtype=np.float32).reshape(-1, 6)
 
-def _triangle_area_2d(tri):
-    (x0, y0), (x1, y1), (x2, y2) = tri
-    return abs((x1 - x0) * (y2 - y0) - (x2 - x0) * (y1 - y0)) / 2.0
+def _gather_triangles(objects, layer_name):
+    """Concatenate the layer's triangles over *objects*, which must all have
+    the layer, into one array.
+    """
+    arrays = [_uv_triangle_array(obj, layer_name) for obj in objects]
+    if not arrays:
+        return np.empty((0, 6), dtype=np.float32)
+    return np.concatenate(arrays)
+
+# Spatial-hash grid resolution is about sqrt(N) cells per axis, so a UV
+# layout of N similarly-sized triangles averages O(1) triangles per cell.
+_GRID_MIN = 8
+_GRID_MAX = 256
+_PAIR_BATCH = 1 << 16  # candidate pairs tested per exact-overlap batch
+_BRUTE_FORCE_BELOW = 32  # triangle count under which every pair is tested
+_MAX_TRI_CELLS = 1024  # grid cells a triangle may cover before it is paired directly
+
+def _grid_resolution(n):
+    return max(_GRID_MIN, min(_GRID_MAX, int(math.sqrt(n))))
+
+def _oversized_pairs(lo, hi, big):
+    """Return ``(a, b)`` pairs between each triangle in *big* and every
+    triangle whose AABB intersects its own, each unordered pair once.
+    """
+    is_big = np.zeros(len(lo), dtype=bool)
+    is_big[big] = True
+    idx = np.arange(len(lo))
+    a_parts = [np.empty(0, dtype=np.int64)]
+    b_parts = [np.empty(0, dtype=np.int64)]
+    for k in big:
+        hit = ((lo[k] <= hi) & (lo <= hi[k])).all(axis=1)
+        # Every other small triangle, but only later big ones, so a pair of
+        # big triangles is not emitted twice.
+        hit &= ~is_big | (idx > k)
+        j = np.flatnonzero(hit)
+        a_parts.append(np.full(len(j), k, dtype=np.int64))
+        b_parts.append(j)
+    return np.concatenate(a_parts), np.concatenate(b_parts)
+
+def _candidate_pairs(lo, hi, grid):
+    """Return ``(a, b)`` index arrays, one entry per unordered pair of
+    triangles whose AABBs, given as ``(N, 2)`` min/max corners, intersect.
+
+    *grid* is the number of hash cells per UV unit along each axis.
+    """
+    n = len(lo)
+    # Cell ranges per triangle; truncation matches ``int()`` and, being
+    # monotonic, keeps every AABB-overlapping pair in a shared cell.
+    c0 = (lo * grid).astype(np.int64)
+    c1 = (hi * grid).astype(np.int64)
+    span = c1 - c0 + 1
+    ny = span[:, 1]
+    per_tri = span[:, 0] * ny
+
+    # A triangle covering many cells, such as a tiling UV reaching far
+    # outside [0, 1], would expand into as many bucket entries.  Pair those
+    # directly instead, which bounds the expansion at n * _MAX_TRI_CELLS.
+    big = per_tri > _MAX_TRI_CELLS
+    if big.any():
+        small = np.flatnonzero(~big)
+        a, b = _oversized_pairs(lo, hi, np.flatnonzero(big))
+        if len(small) < 2:
+            return a, b
+        sa, sb = _candidate_pairs(lo[small], hi[small], grid)
+        return np.concatenate([small[sa], a]), np.concatenate([small[sb], b])
+
+    # Expand every triangle into each cell its AABB covers.
+    owner = np.repeat(np.arange(n), per_tri)
+    local = np.arange(len(owner)) - np.repeat(np.cumsum(per_tri) - per_tri, per_tri)
+    cx = c0[owner, 0] + local // ny[owner]
+    cy = c0[owner, 1] + local % ny[owner]
+    cell = (cx - cx.min()) * (int(cy.max() - cy.min()) + 1) + (cy - cy.min())
+
+    # Bucket by cell into a flat CSR layout: triangle entries sorted by cell
+    # id, with ``starts``/``sizes`` delimiting each bucket.  Order within a
+    # bucket is irrelevant (every unordered pair is formed either way), so
+    # an unstable sort suffices and is several times faster than a stable
+    # one.  Then pair each member with every later one in its bucket.
+    order = np.argsort(cell)
+    cell = cell[order]
+    owner = owner[order]
+    cx = cx[order]
+    cy = cy[order]
+    starts = np.flatnonzero(np.r_[True, cell[1:] != cell[:-1]])
+    sizes = np.diff(np.r_[starts, len(cell)])
+    rank = np.arange(len(cell)) - np.repeat(starts, sizes)
+    later = np.repeat(sizes, sizes) - rank - 1
+    first = np.repeat(np.arange(len(cell)), later)
+    second = first + 1 + (
+        np.arange(len(first)) - np.repeat(np.cumsum(later) - later, later)
+    )
 
-_GRID = 16  # spatial-hash grid resolution
+    a = owner[first]
+    b = owner[second]
+
+    # Sharing a cell only means the AABBs are near each other.  Drop pairs
+    # whose boxes are disjoint (they cannot overlap, even at a boundary).
+    # A touching pair shares every cell its box intersection covers, so keep
+    # it only in the cell holding the intersection's min corner: each pair
+    # then comes out exactly once, with no set, bitmap or sort to dedupe.
+    ix = np.maximum(lo[a, 0], lo[b, 0])
+    iy = np.maximum(lo[a, 1], lo[b, 1])
+    keep = (
+        (ix <= np.minimum(hi[a, 0], hi[b, 0]))
+        & (iy <= np.minimum(hi[a, 1], hi[b, 1]))
+        & ((ix * grid).astype(np.int64) == cx[first])
+        & ((iy * grid).astype(np.int64) == cy[first])
+    )
+    return a[keep], b[keep]
 
 def _find_overlapping_pairs(triangles):
     """Return the count of overlapping triangle pairs using spatial hashing."""
     if len(triangles) < 2:
         return 0
 
-    # Build spatial hash: grid cell → list of triangle indices.
-    grid = {}
-    for idx, tri in enumerate(triangles):
-        x0, y0, x1, y1 = _triangle_aabb(tri)
-        cx0 = int(x0 * _GRID)
-        cy0 = int(y0 * _GRID)
-        cx1 = int(x1 * _GRID)
-        cy1 = int(y1 * _GRID)
-        for cx in range(cx0, cx1 + 1):
-            for cy in range(cy0, cy1 + 1):
-                grid.setdefault((cx, cy), []).append(idx)
-
-    # Check all candidate pairs exactly once.
-    checked = set()
-    overlap_count = 0
-    for cell_indices in grid.values():
-        n = len(cell_indices)
-        for i in range(n):
-            for j in range(i + 1, n):
-                a, b = cell_indices[i], cell_indices[j]
-                pair = (min(a, b), max(a, b))
-                if pair in checked:
-                    continue
-                checked.add(pair)
-                if _triangles_overlap(triangles[a], triangles[b]):
-                    overlap_count += 1
+    tris = np.asarray(triangles, dtype=np.float64).reshape(-1, 3, 2)
+    if not np.isfinite(tris).all():
+        raise ValueError("UV triangles contain non-finite coordinates")
+    lo = tris.min(axis=1)
+    hi = tris.max(axis=1)
+    if len(tris) < _BRUTE_FORCE_BELOW:
+        # Too few triangles for hashing to pay off: test every pair whose
+        # AABBs intersect, which is the same set the grid would produce.
+        first, second = np.triu_indices(len(tris), 1)
+        keep = ((lo[first] <= hi[second]) & (lo[second] <= hi[first])).all(axis=1)
+        first = first[keep]
+        second = second[keep]
+    else:
+        first, second = _candidate_pairs(lo, hi, _grid_resolution(len(tris)))
+
+    # Built once per triangle rather than re-derived for every pair it is
+    # tested in.
+    edges = _precompute_edges(tris)
 
+    overlap_count = 0
+    for start in range(0, len(first), _PAIR_BATCH):
+        stop = start + _PAIR_BATCH
+        hit = _triangles_overlap(edges[first[start:stop]], edges[second[start:stop]])
+        overlap_count += int(np.count_nonzero(hit))
     return overlap_count
 
 # ---------------------------------------------------------------------------
@@ -136,10 +286,9 @@ def _find_overlapping_pairs(triangles):
 # ---------------------------------------------------------------------------
 
 def _check_missing_uvs(
-    objects: list,
-    config: UVConfig,
+    layer_sets: list[frozenset[str]],
 ) -> CheckResult:
-    count = sum(1 for obj in objects if len(obj.uv_layer_names()) == 0)
+    count = sum(1 for names in layer_sets if not names)
     return CheckResult(
         name="missing_uvs",
         status=Status.FAIL if count > 0 else Status.PASS,
@@ -151,17 +300,43 @@ def _check_missing_uvs(
         ),
     )
 
+@dataclass(slots=True)
+class _ObjectUVs:
+    """One mesh object's primary-layer UV data, read once for all checks."""
+
+    loops: np.ndarray      # (L, 2) float32 per-loop UVs
+    triangles: np.ndarray  # (N, 6) float32, see ``_uv_triangle_array``
+    world_area: float
+
+def _collect_uv_data(objects, layer_sets, layer_name):
+    """Read each object's UVs on *layer_name* once, skipping objects without it.
+
+    The bounds, overlap and texel-density checks all derive from this, so
+    UV data crosses the Python/Blender boundary one time per object.
+    """
+    data = []
+    for obj, names in zip(objects, layer_sets):
+        if layer_name not in names:
+            continue
+        data.append(_ObjectUVs(
+            loops=np.asarray(obj.uv_loops(layer_name), dtype=np.float32).reshape(-1, 2),
+            triangles=_uv_triangle_array(obj, layer_name),
+            world_area=obj.world_surface_area(),
+        ))
+    return data
+
 def _check_uv_bounds(
-    objects: list,
-    config: UVConfig,
+    uv_data: list[_ObjectUVs],
 ) -> CheckResult:
-    count = 0
-    for obj in objects:
-        if config.uv_layer_name not in obj.uv_layer_names():
-            continue
-        for u, v in obj.uv_loops(config.uv_layer_name):
-            if not (0.0 <= u <= 1.0 and 0.0 <= v <= 1.0):
-                count += 1
+    # One pass over every object's loops stacked together; only the total
+    # is reported, so no per-object split is needed.
+    if uv_data:
+        loops = np.concatenate([d.loops for d in uv_data])
+    else:
+        loops = np.empty((0, 2), dtype=np.float32)
+    # Written as "not inside" so NaN coordinates count as out of bounds.
+    inside = ((loops >= 0.0) & (loops <= 1.0)).all(axis=1)
+    count = int(np.count_nonzero(~inside))
     return CheckResult(
         name="uv_bounds",
         status=Status.FAIL if count > 0 else Status.PASS,
@@ -174,14 +349,12 @@ def _check_uv_bounds(
     )
 
 def _check_uv_overlap(
-    objects: list,
-    config: UVConfig,
+    uv_data: list[_ObjectUVs],
 ) -> CheckResult:
-    all_tris = []
-    for obj in objects:
-        if config.uv_layer_name in obj.uv_layer_names():
-            all_tris.extend(obj.uv_triangles(config.uv_layer_name))
-
+    if uv_data:
+        all_tris = np.concatenate([d.triangles for d in uv_data])
+    else:
+        all_tris = np.empty((0, 6), dtype=np.float32)
     overlap_count = _find_overlapping_pairs(all_tris)
     return CheckResult(
         name="uv_overlap",
@@ -195,43 +368,45 @@ def _check_uv_overlap(
     )
 
 def _check_texel_density(
-    objects: list,
+    uv_data: list[_ObjectUVs],
     config: UVConfig,
 ) -> CheckResult:
     min_target, max_target = config.texel_density_target_px_per_m
-    densities = []
-
-    for obj in objects:
-        if config.uv_layer_name not in obj.uv_layer_names():
-            continue
-        tris = obj.uv_triangles(config.uv_layer_name)
-        uv_area = sum(_triangle_area_2d(t) for t in tris)
-        world_area = obj.world_surface_area()
-        if world_area > 0 and uv_area > 0:
-            densities.append(uv_area / world_area)
+    densities = np.empty(0)
+
+    if uv_data:
+        # Every triangle's area in one kernel call over the concatenated
+        # array; a weighted bincount then sums each object's run in order.
+        counts = [len(d.triangles) for d in uv_data]
+        areas = _triangle_areas_2d(np.concatenate([d.triangles for d in uv_data]))
+        uv_areas = np.bincount(
+            np.repeat(np.arange(len(uv_data)), counts),
+            weights=areas,
+            minlength=len(uv_data),
+        )
+        world_areas = np.array([d.world_area for d in uv_data], dtype=np.float64)
+        valid = (world_areas > 0) & (uv_areas > 0)
+        densities = uv_areas[valid] / world_areas[valid]
 
-    if not densities:
+    if not densities.size:
         return CheckResult(
             name="texel_density",
             status=Status.SKIPPED,
-            value={"min": 0.0, "max": 0.0, "mean": 0.0, "outlier_count": 0},
+            value=TexelDensityStats(0.0, 0.0, 0.0, 0),
             threshold=(min_target, max_target),
             message="No UV data available for texel density check",
         )
 
-    d_min = min(densities)
-    d_max = max(densities)
-    d_mean = sum(densities) / len(densities)
-    outlier_count = sum(
-        1 for d in densities if d < min_target or d > max_target
+    # Converted back to Python scalars so the report serialises as before.
+    outlier_count = int(np.count_nonzero(
+        (densities < min_target) | (densities > max_target)
+    ))
+    measured = TexelDensityStats(
+        min=float(densities.min()),
+        max=float(densities.max()),
+        mean=float(densities.mean()),
+        outlier_count=outlier_count,
     )
-
-    measured = {
-        "min": d_min,
-        "max": d_max,
-        "mean": d_mean,
-        "outlier_count": outlier_count,
-    }
     return CheckResult(
         name="texel_density",
         status=Status.WARNING if outlier_count > 0 else Status.PASS,
@@ -247,42 +422,42 @@ def _check_texel_density(
 
 def _check_lightmap_uv2(
     objects: list,
+    layer_sets: list[frozenset[str]],
     config: UVConfig,
 ) -> CheckResult:
     if not config.require_lightmap_uv2:
         return CheckResult(
             name="lightmap_uv2",
             status=Status.SKIPPED,
-            value={"present": False, "overlap_count": 0},
+            value=LightmapStats(present=False, overlap_count=0),
             threshold=0,
             message="Lightmap UV2 check skipped (require_lightmap_uv2=False)",
         )
 
-    missing = [
-        obj for obj in objects
-        if config.lightmap_layer_name not in obj.uv_layer_names()
-    ]
+    # Only the count is reported, so count rather than collect the objects;
+    # no triangles are read unless every object has the layer.
+    missing = sum(
+        1 for names in layer_sets
+        if config.lightmap_layer_name not in names
+    )
     if missing:
         return CheckResult(
             name="lightmap_uv2",
             status=Status.FAIL,
-            value={"present": False, "overlap_count": 0},
+            value=LightmapStats(present=False, overlap_count=0),
             threshold=0,
             message=(
                 f"Lightmap UV layer '{config.lightmap_layer_name}' missing on "
-                f"{len(missing)} object(s)"
+                f"{missing} object(s)"
             ),
         )
 
-    all_tris = []
-    for obj in objects:
-        all_tris.extend(obj.uv_triangles(config.lightmap_layer_name))
-
+    all_tris = _gather_triangles(objects, config.lightmap_layer_name)
     overlap_count = _find_overlapping_pairs(all_tris)
     return CheckResult(
         name="lightmap_uv2",
         status=Status.FAIL if overlap_count > 0 else Status.PASS,
-        value={"present": True, "overlap_count": overlap_count},
+        value=LightmapStats(present=True, overlap_count=overlap_count),
         threshold=0,
         message=(
             f"Lightmap UV2 has {overlap_count} overlapping island pair(s)"
@@ -302,13 +477,17 @@ def check_uvs(context, config: UVConfig) -> StageResult:
     it does not cause the stage to fail.
     """
     objects = context.mesh_objects()
+    # Each object's layer names, read once as a column parallel to
+    # ``objects`` and shared by every check that tests layer membership.
+    layer_sets = [frozenset(obj.uv_layer_names()) for obj in objects]
+    uv_data = _collect_uv_data(objects, layer_sets, config.uv_layer_name)
 
     checks = [
-        _check_missing_uvs(objects, config),
-        _check_uv_bounds(objects, config),
-        _check_uv_overlap(objects, config),
-        _check_texel_density(objects, config),
-        _check_lightmap_uv2(objects, config),
+        _check_missing_uvs(layer_sets),
+        _check_uv_bounds(uv_data),
+        _check_uv_overlap(uv_data),
+        _check_texel_density(uv_data, config),
+        _check_lightmap_uv2(objects, layer_sets, config),
     ]
 
     stage_status = (
@@ -16,10 +16,10 @@ fi
 # Allow override via env var (useful for CI or alternate Blender installs)
 BLENDER="${BLENDER_BIN:-/opt/blender-5.0.1-linux-x64/blender}"
 
-# -- Pure Python tests (schema, intake) ------------------------------------
+# -- Pure Python tests (schema, intake, export, uv) ------------------------
 # Fast, no Blender required. Always run these first for quick feedback.
 echo "[asscheck] running pure-python tests..."
-python -m pytest tests/schema.py tests/intake.py -v --tb=short
+python -m pytest tests/schema.py tests/intake.py tests/export.py tests/uv.py -v --tb=short
 
 # -- Blender integration tests --------------------------------------------
 # Runs inside a single Blender process. Tests skip gracefully if assets/ missing.
@@ -30,6 +30,7 @@ ASSETS_DIR = Path(__file__).resolve().parent / "assets"
 
 import bpy          # noqa: E402
 import bmesh as _bmesh  # noqa: E402
+import numpy as np  # noqa: E402
 
 from pipeline.schema import StageResult, Status  # noqa: E402
 
@@ -88,6 +89,7 @@ def _clear_scene():
 class BpyGeomMeshObject:
     def __init__(self, obj):
         self._obj = obj
+        self._bm = None
 
     @property
     def name(self):
@@ -97,9 +99,17 @@ class BpyGeomMeshObject:
         return sum(len(p.vertices) - 2 for p in self._obj.data.polygons)
 
     def bmesh_get(self):
-        bm = _bmesh.new()
-        bm.from_mesh(self._obj.data)
-        return bm
+        # Built on first use and shared by every later caller, as in
+        # BpyUVMeshObject; freed with the wrapper.
+        if self._bm is None:
+            self._bm = _bmesh.new()
+            self._bm.from_mesh(self._obj.data)
+        return self._bm
+
+    def __del__(self):
+        if self._bm is not None:
+            self._bm.free()
+            self._bm = None
 
 
 class BpyGeomContext:
@@ -209,22 +219,26 @@ class BpyUVMeshObject:
         layer = mesh.uv_layers.get(layer_name)
         if layer is None:
             return []
-        return [(ld.uv[0], ld.uv[1]) for ld in layer.data]
+        # One bulk copy instead of a tuple per loop; check_uvs accepts the
+        # (L, 2) array as-is.
+        buf = np.empty(len(layer.data) * 2, dtype=np.float32)
+        layer.data.foreach_get("uv", buf)
+        return buf.reshape(-1, 2)
 
     def uv_triangles(self, layer_name):
-        bm = self._ensure_bm()
-        uv_layer = bm.loops.layers.uv.get(layer_name)
-        if uv_layer is None:
+        mesh = self._obj.data
+        layer = mesh.uv_layers.get(layer_name)
+        if layer is None:
             return []
-        result = []
-        for face in bm.faces:
-            if len(face.loops) == 3:
-                coords = tuple(
-                    (loop[uv_layer].uv[0], loop[uv_layer].uv[1])
-                    for loop in face.loops
-                )
-                result.append(coords)
-        return result
+        # Blender's own tessellation, read in bulk: every loop's UV once,
+        # then gathered by each triangle's three loop indices.  check_uvs
+        # accepts the (N, 3, 2) array as-is.
+        mesh.calc_loop_triangles()
+        tri_loops = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("loops", tri_loops)
+        uvs = np.empty(len(layer.data) * 2, dtype=np.float32)
+        layer.data.foreach_get("uv", uvs)
+        return uvs.reshape(-1, 2)[tri_loops].reshape(-1, 3, 2)
 
     def world_surface_area(self):
         bm = self._ensure_bm()
@@ -0,0 +1,113 @@
+"""Tests for pipeline/export.py — Stage 3: Export & Handoff (file placement)."""
+import json
+import shutil
+
+import pytest
+
+from pipeline import _fs
+from pipeline.export import ExportConfig, run_export
+from pipeline.report_builder import ReportBuilder
+from pipeline.schema import StageResult, Status
+
+
+# ---------------------------------------------------------------------------
+# fast_copy — same-file guard
+# ---------------------------------------------------------------------------
+
+def test_fast_copy_same_file_leaves_file_intact(tmp_path):
+    path = tmp_path / "a1.gltf"
+    path.write_bytes(b"GOOD MESH")
+    with pytest.raises(shutil.SameFileError):
+        _fs.fast_copy(path, path)
+    assert path.read_bytes() == b"GOOD MESH"
+
+
+def test_fast_copy_hardlinked_dst_leaves_file_intact(tmp_path):
+    src = tmp_path / "a1.gltf"
+    src.write_bytes(b"GOOD MESH")
+    dst = tmp_path / "link.gltf"
+    dst.hardlink_to(src)
+    with pytest.raises(shutil.SameFileError):
+        _fs.fast_copy(src, dst)
+    assert src.read_bytes() == b"GOOD MESH"
+
+
+# ---------------------------------------------------------------------------
+# run_export — re-processing an asset
+# ---------------------------------------------------------------------------
+
+class _MockExportContext:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def export_gltf(self, path, embed_textures):
+        with open(path, "wb") as f:
+            f.write(self.payload)
+
+
+class _FailingExportContext:
+    def export_gltf(self, path, embed_textures):
+        with open(path, "wb") as f:
+            f.write(b"PARTIAL")
+        raise RuntimeError("exporter crashed")
+
+    def export_fbx(self, path):
+        self.export_gltf(path, False)
+
+
+def _builder(stage_status):
+    builder = ReportBuilder(
+        asset_id="a1",
+        source="a1.glb",
+        category="env_prop",
+        submitter="tester",
+        submitted="2026-02-19",
+        processed="2026-02-19T12:00:00Z",
+    )
+    builder.add_stage(StageResult(name="geometry", status=stage_status))
+    return builder
+
+
+def _export_config(tmp_path, **overrides):
+    return ExportConfig(
+        output_dir=str(tmp_path / "out"),
+        unity_drop_dir=str(tmp_path / "unity"),
+        review_queue_dir=str(tmp_path / "review"),
+        quarantine_dir=str(tmp_path / "quarantine"),
+        **overrides,
+    )
+
+
+def test_routed_files_are_copies_by_default(tmp_path):
+    run_export(_MockExportContext(b"GOOD MESH"), _builder(Status.PASS), _export_config(tmp_path))
+    out = tmp_path / "out" / "a1" / "a1.gltf"
+    delivered = tmp_path / "unity" / "Art" / "Environment" / "Props" / "a1" / "a1.gltf"
+    assert delivered.read_bytes() == b"GOOD MESH"
+    assert not out.samefile(delivered)
+
+
+@pytest.mark.parametrize("use_hardlinks", [False, True])
+def test_rerun_does_not_rewrite_routed_copy(tmp_path, use_hardlinks):
+    config = _export_config(tmp_path, use_hardlinks=use_hardlinks)
+    _, first = run_export(_MockExportContext(b"GOOD MESH"), _builder(Status.PASS), config)
+    _, second = run_export(_MockExportContext(b"BROKEN MESH"), _builder(Status.FAIL), config)
+    assert (first.status, second.status) == (Status.PASS, Status.FAIL)
+
+    delivered = tmp_path / "unity" / "Art" / "Environment" / "Props" / "a1"
+    assert (delivered / "a1.gltf").read_bytes() == b"GOOD MESH"
+    assert json.loads((delivered / "a1_qa.json").read_text())["status"] == "PASS"
+
+    quarantined = tmp_path / "quarantine" / "a1"
+    assert (quarantined / "a1.gltf").read_bytes() == b"BROKEN MESH"
+    assert json.loads((quarantined / "a1_qa.json").read_text())["status"] == "FAIL"
+
+
+def test_failed_reexport_keeps_previous_output(tmp_path):
+    config = _export_config(tmp_path, use_hardlinks=True)
+    run_export(_MockExportContext(b"GOOD MESH"), _builder(Status.PASS), config)
+    with pytest.raises(RuntimeError):
+        run_export(_FailingExportContext(), _builder(Status.PASS), config)
+
+    out = tmp_path / "out" / "a1"
+    assert (out / "a1.gltf").read_bytes() == b"GOOD MESH"
+    assert json.loads((out / "a1_qa.json").read_text())["status"] == "PASS"
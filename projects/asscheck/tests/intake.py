@@ -103,7 +103,7 @@ def test_exceeds_category_limit_warns_but_passes():
     report = run_intake(config)
     stage = report.stages[0]
     assert stage.status == Status.PASS
-    size_check = next(c for c in stage.checks if c.name == "file_size")
+    size_check = stage.checks_by_name["file_size"]
     assert size_check.status == Status.WARNING
 
 
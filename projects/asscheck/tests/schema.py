@@ -2,6 +2,8 @@ import dataclasses
 import json
 
 from pipeline.report_builder import ReportBuilder
+from pipeline.texture import ColorSpaceViolation, ResolutionViolation
+from pipeline.uv import UVConfig, check_uvs
 from pipeline.schema import (
     CheckResult,
     ExportInfo,
@@ -11,6 +13,7 @@ from pipeline.schema import (
     ReviewFlag,
     StageResult,
     Status,
+    check_to_dict,
 )
 
 
@@ -131,3 +134,94 @@ def test_json_serializable():
     assert restored["asset_id"] == "asset-001"
     assert restored["stages"][0]["checks"][0]["value"] == 1000
     assert restored["performance"]["triangles"] == 1000
+
+
+def test_to_dict_matches_asdict():
+    report = _make_full_report()
+    # Equal values of different types must keep their own type.
+    report.stages[0].checks.extend(
+        CheckResult(name="orphans", status=Status.PASS, value=v, threshold=0, message="ok")
+        for v in (0, 0.0, False)
+    )
+    expected = json.loads(json.dumps(dataclasses.asdict(report)))
+    actual = json.loads(json.dumps(report.to_dict()))
+    assert actual == expected
+    assert [type(c["value"]) for c in actual["stages"][0]["checks"]] == [
+        type(c["value"]) for c in expected["stages"][0]["checks"]
+    ]
+
+
+def test_to_dict_converts_dataclass_records():
+    @dataclasses.dataclass(frozen=True, slots=True)
+    class Violation:
+        name: str
+        size: tuple[int, int]
+
+    check = CheckResult(
+        name="power_of_two",
+        status=Status.FAIL,
+        value={"violations": [Violation("albedo", (1000, 512))]},
+        threshold=0,
+        message="1 image(s) have non-power-of-two dimensions",
+    )
+    d = check_to_dict(check)
+    assert d["value"] == {"violations": [{"name": "albedo", "size": (1000, 512)}]}
+    encoded = json.loads(json.dumps(d))
+    assert encoded["value"]["violations"] == [{"name": "albedo", "size": [1000, 512]}]
+
+
+def test_to_dict_round_trips_uv_and_texture_records():
+    class _NoMeshes:
+        def mesh_objects(self):
+            return []
+
+    builder = _make_builder()
+    builder.add_stage(check_uvs(_NoMeshes(), UVConfig()))
+    builder.add_stage(StageResult(
+        name="texture",
+        status=Status.FAIL,
+        checks=[
+            CheckResult(
+                name="resolution_limit",
+                status=Status.FAIL,
+                value={"violations": [ResolutionViolation("albedo", (8192, 8192), 4096)]},
+                threshold=4096,
+                message="1 image(s) exceed resolution limit",
+            ),
+            CheckResult(
+                name="color_space",
+                status=Status.FAIL,
+                value={"violations": [ColorSpaceViolation("normal", "Non-Color", "sRGB")]},
+                threshold=None,
+                message="1 image(s) have the wrong color space",
+            ),
+        ],
+    ))
+    report = builder.finalize()
+
+    restored = json.loads(json.dumps(report.to_dict()))
+    assert restored == json.loads(json.dumps(dataclasses.asdict(report)))
+    uv_checks = {c["name"]: c["value"] for c in restored["stages"][0]["checks"]}
+    assert uv_checks["texel_density"] == {"min": 0.0, "max": 0.0, "mean": 0.0, "outlier_count": 0}
+    assert uv_checks["lightmap_uv2"] == {"present": False, "overlap_count": 0}
+    texture_checks = restored["stages"][1]["checks"]
+    assert texture_checks[0]["value"]["violations"] == [
+        {"name": "albedo", "size": [8192, 8192], "limit": 4096}
+    ]
+
+
+def test_checks_by_name_first_wins():
+    first = CheckResult("polycount", Status.PASS, 10, 100, "ok")
+    stage = StageResult(
+        name="geometry",
+        status=Status.PASS,
+        checks=[
+            first,
+            CheckResult("normals", Status.FAIL, 3, 0, "flipped"),
+            CheckResult("polycount", Status.FAIL, 500, 100, "duplicate"),
+        ],
+    )
+    by_name = stage.checks_by_name
+    assert set(by_name) == {"polycount", "normals"}
+    assert by_name["polycount"] is first
+    assert by_name["normals"].status == Status.FAIL
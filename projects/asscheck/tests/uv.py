@@ -0,0 +1,139 @@
+"""Tests for pipeline/uv.py — UV overlap detection (no Blender required)."""
+import numpy as np
+import pytest
+
+import pipeline.uv as uv
+from pipeline.uv import (
+    _BRUTE_FORCE_BELOW,
+    _find_overlapping_pairs,
+)
+
+
+# ---------------------------------------------------------------------------
+# Brute-force reference: every pair, scalar arithmetic
+# ---------------------------------------------------------------------------
+
+def _cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _segments_cross(a0, a1, b0, b1):
+    d1 = _cross(b0, b1, a0)
+    d2 = _cross(b0, b1, a1)
+    d3 = _cross(a0, a1, b0)
+    d4 = _cross(a0, a1, b1)
+    return (
+        ((d1 > 0 and d2 < 0) or (d1 < 0 and d2 > 0))
+        and ((d3 > 0 and d4 < 0) or (d3 < 0 and d4 > 0))
+    )
+
+
+def _point_in(p, t):
+    d = [_cross(t[i], t[(i + 1) % 3], p) for i in range(3)]
+    return not (any(x < 0 for x in d) and any(x > 0 for x in d))
+
+
+def _overlap(t1, t2):
+    for i in range(3):
+        for j in range(3):
+            if _segments_cross(t1[i], t1[(i + 1) % 3], t2[j], t2[(j + 1) % 3]):
+                return True
+    return _point_in(t1[0], t2) or _point_in(t2[0], t1)
+
+
+def _reference_count(tris):
+    tris = tris.astype(np.float64).reshape(-1, 3, 2).tolist()
+    boxes = [
+        (min(x for x, _ in t), min(y for _, y in t), max(x for x, _ in t), max(y for _, y in t))
+        for t in tris
+    ]
+    count = 0
+    for i in range(len(tris)):
+        for j in range(i + 1, len(tris)):
+            a, b = boxes[i], boxes[j]
+            if (
+                a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+                and _overlap(tris[i], tris[j])
+            ):
+                count += 1
+    return count
+
+
+def _as_uvs(tris):
+    """Round to float32 ``(N, 6)`` as Blender stores UVs."""
+    return np.asarray(tris, dtype=np.float32).reshape(-1, 6)
+
+
+def _scattered(rng, n, lo=0.0, hi=1.0, size=0.08):
+    anchors = rng.uniform(lo, hi, (n, 1, 2))
+    return anchors + rng.uniform(0.0, size, (n, 3, 2))
+
+
+def _grid_mesh(n):
+    tris = []
+    for i in range(n):
+        for j in range(n):
+            a, b = (i / n, j / n), ((i + 1) / n, j / n)
+            c, d = (i / n, (j + 1) / n), ((i + 1) / n, (j + 1) / n)
+            tris += [(a, b, d), (a, d, c)]
+    return tris
+
+
+def _assert_matches_reference(tris):
+    expected = _reference_count(tris)
+    assert _find_overlapping_pairs(tris) == expected
+    return expected
+
+
+# ---------------------------------------------------------------------------
+# Grid broadphase vs. brute force
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("seed", range(5))
+def test_scattered_triangles_match_reference(seed):
+    tris = _as_uvs(_scattered(np.random.default_rng(seed), 200))
+    assert len(tris) > _BRUTE_FORCE_BELOW
+    assert _assert_matches_reference(tris) > 0
+
+
+def test_small_input_matches_reference():
+    tris = _as_uvs(_scattered(np.random.default_rng(7), _BRUTE_FORCE_BELOW - 1, size=0.3))
+    assert _assert_matches_reference(tris) > 0
+
+
+def test_out_of_bounds_coordinates_match_reference():
+    tris = _as_uvs(_scattered(np.random.default_rng(11), 150, lo=-2.5, hi=3.5, size=0.6))
+    assert (tris < 0).any() and (tris > 1).any()
+    assert _assert_matches_reference(tris) > 0
+
+
+def test_shared_vertices_and_duplicates_match_reference():
+    mesh = _grid_mesh(8)
+    tris = _as_uvs(mesh + mesh[:20] + [((0.5, 0.5),) * 3])
+    assert _assert_matches_reference(tris) > 0
+
+
+def test_tiling_triangles_above_cell_cap_match_reference(monkeypatch):
+    # Spanning tens of UV units, these cover far more than _MAX_TRI_CELLS
+    # grid cells and must be paired outside the grid.
+    oversized_calls = []
+    real = uv._oversized_pairs
+
+    def spy(lo, hi, big):
+        oversized_calls.append(len(big))
+        return real(lo, hi, big)
+
+    monkeypatch.setattr(uv, "_oversized_pairs", spy)
+    rng = np.random.default_rng(3)
+    small = _scattered(rng, 250, size=0.02)
+    tiling = [[(0.0, 0.0), (30.0, 0.0), (0.0, 30.0)], [(-4.0, -4.0), (12.0, 0.5), (0.5, 12.0)]]
+    tris = _as_uvs(np.concatenate([small, tiling]))
+    assert _assert_matches_reference(tris) > 0
+    assert oversized_calls == [2]  # both tiling triangles bypass the grid
+
+
+def test_non_finite_coordinates_raise():
+    tris = _as_uvs(_scattered(np.random.default_rng(0), 40))
+    tris[5, 2] = np.nan
+    with pytest.raises(ValueError):
+        _find_overlapping_pairs(tris)